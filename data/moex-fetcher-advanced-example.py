@@ -13,9 +13,9 @@ This script demonstrates more complex usage patterns including:
 
 import concurrent.futures
 import datetime
-import functools
+import pathlib
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -32,28 +32,54 @@ from moex_fetcher.endpoints import (
 )
 
 
-# Cache frequently accessed data
-@functools.lru_cache(maxsize=128)
-def get_cached_security_history(
-    client, ticker, interval, start_date, end_date, board
-):
+# On-disk cache for the client: candles of date ranges that have already
+# ended are stored here and reused across runs (see MoexApiClient.cache_dir)
+CACHE_DIR = pathlib.Path(".moex_cache")
+
+
+def get_cached_stock_candles(
+    client: MoexApiClient,
+    ticker: str,
+    interval: str,
+    start_date: datetime.date,
+    end_date: datetime.date,
+    board: str = "TQBR",
+) -> pd.DataFrame:
     """
-    Cache security history data to improve performance for repeated calls.
+    Fetch stock candles, reusing the client's disk cache across runs.
+    
+    The client only caches date ranges that have already ended, so a range
+    reaching today is split: candles up to yesterday go through the cache
+    (fetched once, then read from CACHE_DIR), and only today's candles are
+    requested live. For week/month intervals the current period appears in
+    both parts; the live candle wins.
     
     Args:
-        client: MoexApiClient instance
+        client: MoexApiClient instance (created with a cache_dir)
         ticker: Security ticker
-        interval: Candle interval
-        start_date: Start date (as string)
-        end_date: End date (as string)
+        interval: Candle interval (min, hour, day, etc.)
+        start_date: Start date
+        end_date: End date
         board: Trading board
         
     Returns:
-        DataFrame with security history
+        DataFrame with candles for the whole range
     """
-    return get_stock_candles(
-        client, ticker, interval, start_date, end_date, board
-    )
+    today = datetime.date.today()
+    if end_date < today:
+        return get_stock_candles(client, ticker, interval, start_date, end_date, board)
+    
+    frames = []
+    yesterday = today - datetime.timedelta(days=1)
+    if start_date <= yesterday:
+        frames.append(get_stock_candles(client, ticker, interval, start_date, yesterday, board))
+    frames.append(get_stock_candles(client, ticker, interval, today, end_date, board))
+    
+    frames = [df for df in frames if not df.empty] or frames[-1:]
+    df = pd.concat(frames, ignore_index=True)
+    if 'begin' in df.columns:
+        df = df.drop_duplicates('begin', keep='last', ignore_index=True)
+    return df
 
 
 def get_multiple_securities_data(
@@ -80,24 +106,24 @@ def get_multiple_securities_data(
     end_date = datetime.date.today()
     start_date = end_date - datetime.timedelta(days=days_back)
     
-    # Format dates as strings for caching
-    start_str = start_date.strftime('%Y-%m-%d')
-    end_str = end_date.strftime('%Y-%m-%d')
-    
     # Define worker function
     def fetch_security(ticker):
         try:
-            return ticker, get_cached_security_history(
-                client, ticker, interval, start_str, end_str, "TQBR"
+            return ticker, get_cached_stock_candles(
+                client, ticker, interval, start_date, end_date, "TQBR"
             )
         except Exception as e:
             print(f"Error fetching data for {ticker}: {str(e)}")
             return ticker, None
     
-    # Use ThreadPoolExecutor for parallel fetching
+    # Use ThreadPoolExecutor for parallel fetching; collect results as they
+    # complete rather than in submission order, so one slow ticker does not
+    # hold back the others
     results = {}
     with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        for ticker, data in executor.map(fetch_security, tickers):
+        futures = [executor.submit(fetch_security, ticker) for ticker in tickers]
+        for future in concurrent.futures.as_completed(futures):
+            ticker, data = future.result()
             if data is not None:
                 results[ticker] = data
     
@@ -180,82 +206,110 @@ def calculate_metrics(
         client, tickers, interval="day", days_back=days_back
     )
     
-    # Prepare results
-    metrics = []
+    # Need at least 20 returns, i.e. 21 valid closes; rows without a close are
+    # dropped so returns span the gaps the same way on every pandas version
+    selected = [
+        (ticker, df[df['close'].notna()]) for ticker, df in securities_data.items()
+        if df is not None and df['close'].notna().sum() > 20
+    ]
     
-    # Process each security
-    for ticker, df in securities_data.items():
-        if df is None or df.empty or len(df) < 20:
-            continue
-        
-        # Calculate returns
-        df['return'] = df['close'].pct_change()
-        
-        # Calculate metrics
-        try:
-            # Skip first row with NaN return
-            returns = df['return'].iloc[1:].dropna()
-            
-            # Only calculate if we have enough data
-            if len(returns) < 20:
-                continue
-                
-            volatility = returns.std() * np.sqrt(252)  # Annualized volatility
-            sharpe = (returns.mean() * 252) / volatility  # Annualized Sharpe ratio
-            max_drawdown = calculate_max_drawdown(df['close'])
-            
-            # Latest price and 52-week range
-            latest_price = df['close'].iloc[-1]
-            high_52w = df['high'].max()
-            low_52w = df['low'].min()
-            
-            # Prepare metrics row
-            metrics.append({
-                'ticker': ticker,
-                'latest_price': latest_price,
-                'change_percent': (df['close'].iloc[-1] / df['close'].iloc[0] - 1) * 100,
-                'volatility': volatility * 100,  # As percentage
-                'sharpe_ratio': sharpe,
-                'max_drawdown': max_drawdown * 100,  # As percentage
-                'high_52w': high_52w,
-                'low_52w': low_52w,
-                'high_52w_percent': (latest_price / high_52w - 1) * 100,  # % from 52w high
-                'low_52w_percent': (latest_price / low_52w - 1) * 100,  # % from 52w low
-            })
-            
-        except Exception as e:
-            print(f"Error calculating metrics for {ticker}: {str(e)}")
+    if not selected:
+        return pd.DataFrame()
+    
+    # Stack all securities into one long-format frame so every metric is
+    # computed by a single grouped pass instead of once per ticker. Columns
+    # are concatenated as typed arrays, so no per-ticker frames are built.
+    prices = pd.DataFrame({
+        'ticker': np.repeat([ticker for ticker, _ in selected], [len(df) for _, df in selected]),
+        'close': np.concatenate([df['close'].to_numpy(dtype=np.float64) for _, df in selected]),
+        'high': np.concatenate([df['high'].to_numpy(dtype=np.float64) for _, df in selected]),
+        'low': np.concatenate([df['low'].to_numpy(dtype=np.float64) for _, df in selected]),
+    })
+    by_ticker = prices.groupby('ticker', sort=False)
+    
+    # Simple returns and running drawdown within each security
+    prices['return'] = by_ticker['close'].pct_change(fill_method=None)
+    prices['drawdown'] = prices['close'] / by_ticker['close'].cummax() - 1.0
+    
+    stats = prices.groupby('ticker', sort=False).agg(
+        first_close=('close', 'first'),
+        latest_price=('close', 'last'),
+        return_mean=('return', 'mean'),
+        return_std=('return', 'std'),
+        max_drawdown=('drawdown', 'min'),
+        high_52w=('high', 'max'),
+        low_52w=('low', 'min'),
+    )
+    
+    volatility = stats['return_std'] * np.sqrt(252)  # Annualized volatility
     
-    # Convert to DataFrame
-    metrics_df = pd.DataFrame(metrics)
+    metrics_df = pd.DataFrame({
+        'latest_price': stats['latest_price'],
+        'change_percent': (stats['latest_price'] / stats['first_close'] - 1) * 100,
+        'volatility': volatility * 100,  # As percentage
+        'sharpe_ratio': (stats['return_mean'] * 252) / volatility,  # Annualized Sharpe ratio
+        'max_drawdown': stats['max_drawdown'] * 100,  # As percentage
+        'high_52w': stats['high_52w'],
+        'low_52w': stats['low_52w'],
+        'high_52w_percent': (stats['latest_price'] / stats['high_52w'] - 1) * 100,  # % from 52w high
+        'low_52w_percent': (stats['latest_price'] / stats['low_52w'] - 1) * 100,  # % from 52w low
+    }).reset_index()
     
     # Sort by change percent
-    if not metrics_df.empty:
-        metrics_df.sort_values(by='change_percent', ascending=False, inplace=True)
+    metrics_df.sort_values(by='change_percent', ascending=False, inplace=True)
     
     return metrics_df
 
 
-def calculate_max_drawdown(prices: pd.Series) -> float:
+def calculate_max_drawdown(prices: Union[pd.Series, np.ndarray]) -> float:
     """
     Calculate the maximum drawdown for a price series.
     
     Args:
-        prices: Series of prices
+        prices: Series or array of prices
         
     Returns:
         Maximum drawdown as a decimal (not percentage)
     """
-    # Calculate cumulative maximum
-    rolling_max = prices.cummax()
+    prices = np.asarray(prices, dtype=np.float64)
     
-    # Calculate drawdowns
-    drawdowns = (prices / rolling_max) - 1
+    # Calculate cumulative maximum
+    rolling_max = np.maximum.accumulate(prices)
     
     # Find maximum drawdown
-    max_drawdown = drawdowns.min()
+    return float((prices / rolling_max - 1.0).min())
+
+
+def calculate_return_stats(
+    prices: Union[pd.Series, np.ndarray],
+) -> Tuple[float, float, float, float]:
+    """
+    Calculate return statistics for a price series.
+    
+    All statistics are computed from one contiguous float64 array using
+    NumPy reductions, without intermediate pandas objects.
     
-    return max_drawdown
+    Args:
+        prices: Series or array of at least two prices, without NaNs
+        
+    Returns:
+        Tuple of (annualized volatility, annualized Sharpe ratio,
+        maximum drawdown, total return), all as decimals. Volatility and
+        Sharpe ratio are NaN when there are fewer than two returns.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    returns = prices[1:] / prices[:-1] - 1.0
+    
+    # The sample standard deviation needs at least two returns
+    if returns.size < 2:
+        volatility = sharpe = float("nan")
+    else:
+        volatility = float(returns.std(ddof=1) * np.sqrt(252))
+        sharpe = float(returns.mean() * 252 / volatility) if volatility else float("nan")
+    max_drawdown = calculate_max_drawdown(prices)
+    total_return = float(prices[-1] / prices[0] - 1.0)
+    
+    return volatility, sharpe, max_drawdown, total_return
 
 
 def analyze_index_stocks(client: MoexApiClient, index_id: str = "IMOEX") -> pd.DataFrame:
@@ -284,12 +338,11 @@ def analyze_index_stocks(client: MoexApiClient, index_id: str = "IMOEX") -> pd.D
     
     # Merge with index weights
     if not metrics.empty:
-        result = pd.merge(
-            metrics,
+        result = metrics.merge(
             composition[['ticker', 'weight']],
-            left_on='ticker',
-            right_on='ticker',
-            how='left'
+            on='ticker',
+            how='left',
+            validate='one_to_one',
         )
         
         # Calculate weighted return contribution
@@ -316,7 +369,7 @@ def plot_security_with_volume(
     # Fetch data
     end_date = datetime.date.today()
     start_date = end_date - datetime.timedelta(days=days_back)
-    df = get_stock_candles(
+    df = get_cached_stock_candles(
         client, ticker, interval="day", 
         start_date=start_date, end_date=end_date
     )
@@ -425,7 +478,7 @@ def perform_multi_timeframe_security_analysis(
     for interval, days in timeframes.items():
         start_date = end_date - datetime.timedelta(days=days)
         try:
-            df = get_stock_candles(
+            df = get_cached_stock_candles(
                 client, ticker, interval=interval, 
                 start_date=start_date, end_date=end_date
             )
@@ -437,30 +490,23 @@ def perform_multi_timeframe_security_analysis(
     
     # Calculate key metrics for each timeframe
     for interval, df in data.items():
-        if df is None or df.empty:
+        closes = df['close'].dropna()
+        if len(closes) < 2:
             continue
-            
-        # Add returns
-        df['return'] = df['close'].pct_change()
         
-        # Calculate metrics
-        returns = df['return'].dropna()
+        volatility, sharpe, max_drawdown, total_return = calculate_return_stats(closes)
         
-        if not returns.empty:
-            volatility = returns.std() * np.sqrt(252)  # Annualized
-            total_return = (df['close'].iloc[-1] / df['close'].iloc[0] - 1) * 100
-            
-            print(f"\n{interval.capitalize()} metrics for {ticker}:")
-            print(f"  Total Return: {total_return:.2f}%")
-            print(f"  Annualized Volatility: {volatility * 100:.2f}%")
-            print(f"  Sharpe Ratio: {(returns.mean() * 252) / volatility:.2f}")
-            print(f"  Max Drawdown: {calculate_max_drawdown(df['close']) * 100:.2f}%")
+        print(f"\n{interval.capitalize()} metrics for {ticker}:")
+        print(f"  Total Return: {total_return * 100:.2f}%")
+        print(f"  Annualized Volatility: {volatility * 100:.2f}%")
+        print(f"  Sharpe Ratio: {sharpe:.2f}")
+        print(f"  Max Drawdown: {max_drawdown * 100:.2f}%")
 
 
 def main():
     """Run the advanced example script."""
-    # Initialize the API client
-    client = MoexApiClient()
+    # Initialize the API client (closed date ranges are cached on disk)
+    client = MoexApiClient(cache_dir=CACHE_DIR)
     
     try:
         # Example 1: Compare multiple securities
@@ -7,12 +7,26 @@ response parsing, error handling, and rate limiting.
 """
 
 import datetime
+import hashlib
 import json
+import os
+import pathlib
+import random
+import threading
 import time
-from typing import Dict, List, Optional, Union, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Union, Any, Tuple
 
 import requests
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the standard library
+    _json_loads = json.loads
 
 from .exceptions import (
     MoexApiError,
@@ -22,10 +36,88 @@ from .exceptions import (
     MoexRateLimitError,
     MoexParsingError,
 )
-from .parsers import parse_json_response, response_to_dataframe, normalize_dataframe
+from .parsers import (
+    parse_json_response,
+    block_to_dataframe,
+    json_response_to_dataframe,
+)
 from .utils import build_url, validate_date_range, build_query_params
 
 
+# Endpoint path templates, filled in by the API methods with str.format
+_ENDPOINTS = {
+    "engines": "/engines",
+    "markets": "/engines/{engine}/markets",
+    "boards": "/engines/{engine}/markets/{market}/boards",
+    "securities": "/securities",
+    "board_securities": "/engines/{engine}/markets/{market}/boards/{board}/securities",
+    "market_securities": "/engines/{engine}/markets/{market}/securities",
+    "security": "/securities/{security}",
+    "board_security": "/engines/{engine}/markets/{market}/boards/{board}/securities/{security}",
+    "security_marketdata": "/securities/{security}/marketdata",
+    "orderbook": "/engines/{engine}/markets/{market}/boards/{board}/securities/{security}/orderbook",
+    "board_trades": "/engines/{engine}/markets/{market}/boards/{board}/securities/{security}/trades",
+    "market_trades": "/engines/{engine}/markets/{market}/securities/{security}/trades",
+    "board_candles": "/engines/{engine}/markets/{market}/boards/{board}/securities/{security}/candles",
+    "boardgroup_candles": "/engines/{engine}/markets/{market}/boardgroups/{boardgroup}/securities/{security}/candles",
+    "market_candles": "/engines/{engine}/markets/{market}/securities/{security}/candles",
+    "board_history": "/history/engines/{engine}/markets/{market}/boards/{board}/securities/{security}",
+    "market_history": "/history/engines/{engine}/markets/{market}/securities/{security}",
+    "board_history_all": "/history/engines/{engine}/markets/{market}/boards/{board}/securities",
+    "indices": "/statistics/engines/stock/markets/index/analytics",
+    "index_tickers": "/statistics/engines/stock/markets/index/analytics/{indexid}/tickers",
+}
+
+# Column dtypes applied while building normalized DataFrames; columns not listed
+# keep the type pandas infers from the decoded JSON values. Low-cardinality codes
+# (boards, currencies, security types) that repeat on every row are categorical.
+_BLOCK_DTYPES = {
+    "candles": {
+        "begin": "datetime64[ns]",
+        "end": "datetime64[ns]",
+        "open": "float64",
+        "close": "float64",
+        "high": "float64",
+        "low": "float64",
+        "value": "float64",
+    },
+    "history": {
+        "BOARDID": "category",
+        "TRADEDATE": "datetime64[ns]",
+        "OPEN": "float64",
+        "LOW": "float64",
+        "HIGH": "float64",
+        "CLOSE": "float64",
+        "WAPRICE": "float64",
+        "VALUE": "float64",
+    },
+    "securities": {
+        "BOARDID": "category",
+        "CURRENCYID": "category",
+        "SECTYPE": "category",
+        "INSTRID": "category",
+        "MARKETCODE": "category",
+        "type": "category",
+        "group": "category",
+        "primary_boardid": "category",
+        "PREVPRICE": "float64",
+        "FACEVALUE": "float64",
+    },
+    "marketdata": {
+        "BOARDID": "category",
+        "LAST": "float64",
+        "OPEN": "float64",
+        "LOW": "float64",
+        "HIGH": "float64",
+        "WAPRICE": "float64",
+    },
+    "trades": {
+        "BOARDID": "category",
+        "BUYSELL": "category",
+    },
+}
+
+
 class MoexApiClient:
     """
     Client for the Moscow Exchange (MOEX) ISS API.
@@ -36,20 +128,42 @@ class MoexApiClient:
     Attributes:
         base_url: The base URL for the MOEX ISS API.
         session: The requests Session used for making HTTP requests.
-        rate_limit: The minimum seconds between API requests (for rate limiting).
-        last_request_time: Timestamp of the last request (for rate limiting).
+        rate_limit: The minimum seconds between API requests at full speed (for rate limiting).
+        burst: How many requests may be sent back to back after an idle period.
+        max_retries: How many times a failed request is retried.
+        base_backoff: Base delay in seconds for exponential backoff between retries.
+        cache_dir: Directory for cached securities, index components and candles/history
+                   of closed date ranges (None disables it).
     """
     
     # Constants
     BASE_URL = "https://iss.moex.com/iss"
     DEFAULT_FORMAT = "json"
+    BASE_QUERY = {"iss.meta": "off"}  # Query parameters sent with every request
     RATE_LIMIT = 0.2  # Seconds between requests (5 requests per second)
+    RATE_BURST = 1  # Requests that may go out back to back before rate_limit applies
+    MAX_WORKERS = 5  # Concurrent requests for the get_many_* helpers
+    POOL_MAXSIZE = 20  # Keep-alive connections kept open to the ISS host
+    REFERENCE_TTL = 24 * 60 * 60  # Seconds to reuse engines/markets/boards/indices listings
+    SECURITIES_TTL = 24 * 60 * 60  # Seconds a securities listing stays valid in cache_dir
+    INDEX_COMPONENTS_TTL = 7 * 24 * 60 * 60  # Seconds index components stay valid in cache_dir
+    MIN_RATE_FACTOR = 0.1  # Lowest fraction of the full request rate after backing off
+    RATE_FACTOR_STEP = 0.1  # Fraction of the full rate regained per successful request
+    MAX_RETRIES = 3  # Retries for connection errors, 429 and transient 5xx responses
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})  # Server errors worth retrying
+    BASE_BACKOFF = 0.5  # Seconds before the first retry (doubled on each attempt)
+    MAX_BACKOFF = 30.0  # Upper bound on the backoff delay in seconds
+    ERROR_BODY_BYTES = 512  # Leading bytes of an unparsable body kept on MoexParsingError
     
     def __init__(
         self,
         session: Optional[requests.Session] = None,
         rate_limit: Optional[float] = None,
         timeout: Optional[int] = 30,
+        max_retries: Optional[int] = None,
+        base_backoff: Optional[float] = None,
+        cache_dir: Optional[Union[str, os.PathLike]] = None,
+        burst: Optional[int] = None,
     ):
         """
         Initializes the MOEX API client.
@@ -58,19 +172,99 @@ class MoexApiClient:
             session: An existing requests.Session (a new one is created if None).
             rate_limit: Minimum seconds between requests (for rate limiting).
             timeout: Default timeout for requests in seconds.
+            max_retries: How many times to retry connection errors, 429 and 5xx responses.
+            base_backoff: Base delay in seconds for exponential backoff between retries.
+            cache_dir: Directory to keep securities listings and index components for a
+                       limited time, and candles and history for date ranges that ended
+                       before today, which no longer change (no disk cache if None).
+            burst: Size of the token bucket, i.e. how many requests may be sent
+                   without waiting after the client has been idle (defaults to 1).
         """
         self.base_url = self.BASE_URL
-        self.session = session or requests.Session()
+        self.session = session or self._create_session()
         self.rate_limit = rate_limit or self.RATE_LIMIT
         self.timeout = timeout
-        self.last_request_time = 0.0
+        self.max_retries = self.MAX_RETRIES if max_retries is None else max_retries
+        self.base_backoff = self.BASE_BACKOFF if base_backoff is None else base_backoff
+        self.cache_dir = pathlib.Path(cache_dir).expanduser() if cache_dir else None
+        self.burst = max(1, self.RATE_BURST if burst is None else burst)
+        
+        # Token bucket state (see _enforce_rate_limit)
+        self._rate_lock = threading.Lock()
+        self._capacity = float(self.burst)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._rate_factor = 1.0
+        
+        # Reference listings keyed by endpoint: (expiry, DataFrame, ETag)
+        self._reference_cache: Dict[str, Tuple[float, pd.DataFrame, Optional[str]]] = {}
+    
+    def _create_session(self) -> requests.Session:
+        """
+        Creates the default HTTP session.
+        
+        All requests go to a single host, so one connection pool is mounted and
+        sized to keep enough keep-alive connections open for concurrent requests.
+        The session advertises every content encoding urllib3 can decode, which
+        includes Brotli when the brotli package is installed.
+        
+        Returns:
+            A requests.Session with the pooled adapter mounted for HTTPS.
+        """
+        session = requests.Session()
+        session.headers.update(make_headers(accept_encoding=True))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        return session
     
     def _enforce_rate_limit(self):
-        """Enforces rate limiting by waiting if necessary."""
-        if self.rate_limit:
-            elapsed = time.time() - self.last_request_time
-            if elapsed < self.rate_limit:
-                time.sleep(self.rate_limit - elapsed)
+        """
+        Enforces rate limiting by waiting if necessary.
+        
+        Implements a token bucket refilled at `_rate_factor / rate_limit` tokens
+        per second and holding up to `burst` tokens; each request consumes one
+        token, so an idle client may send a short burst before being paced.
+        The factor adapts to the server: it grows back towards 1 on successful
+        responses and is halved when the API answers with 429.
+        
+        The bucket is updated under a lock, so requests issued from several
+        threads share the same budget. A request that finds the bucket empty
+        reserves its token by letting the balance go negative, then sleeps
+        outside the lock, so other threads can report responses meanwhile.
+        """
+        if not self.rate_limit:
+            return
+        
+        with self._rate_lock:
+            rate = self._rate_factor / self.rate_limit
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._last_refill) * rate
+            )
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / rate if self._tokens < 0 else 0
+        
+        if wait:
+            time.sleep(wait)
+    
+    def _on_success(self):
+        """Increases the request rate after a successful response."""
+        with self._rate_lock:
+            self._rate_factor = min(1.0, self._rate_factor + self.RATE_FACTOR_STEP)
+    
+    def _on_rate_limited(self, retry_after: int):
+        """
+        Halves the request rate and pauses the bucket after a 429 response.
+        
+        Args:
+            retry_after: Seconds the server asked us to wait before the next request.
+        """
+        with self._rate_lock:
+            self._rate_factor = max(self.MIN_RATE_FACTOR, self._rate_factor / 2)
+            self._tokens = min(self._tokens, 0.0)  # Keep tokens reserved by waiting threads
+            self._last_refill = time.monotonic() + retry_after
     
     def _make_request(
         self,
@@ -80,10 +274,17 @@ class MoexApiClient:
         method: str = "GET",
         timeout: Optional[int] = None,
         format_type: str = DEFAULT_FORMAT,
+        headers: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
         """
         Makes an HTTP request to the MOEX ISS API.
         
+        Connection errors and transient server errors (RETRY_STATUSES) are
+        retried up to max_retries times with exponential backoff and jitter.
+        429 responses are retried as well; the token bucket holds the next
+        attempt back until Retry-After has passed, or the attempt backs off
+        like a connection error if the server did not send the header.
+        
         Args:
             endpoint: The API endpoint path.
             params: Query parameters for the request.
@@ -91,6 +292,7 @@ class MoexApiClient:
             method: HTTP method (GET, POST, etc.).
             timeout: Request timeout in seconds.
             format_type: Response format (json, xml, etc.).
+            headers: Additional HTTP headers to send with the request.
         
         Returns:
             The HTTP response object.
@@ -101,58 +303,105 @@ class MoexApiClient:
             MoexAuthError: If authentication fails.
             MoexRateLimitError: If rate limits are exceeded.
         """
-        # Enforce rate limiting
-        self._enforce_rate_limit()
-        
-        # Process path parameters
-        path_params = path_params or {}
-        url = build_url(self.base_url, endpoint, **path_params)
+        # Substitute path parameters (API methods pass pre-formatted endpoints)
+        if path_params:
+            url = build_url(self.base_url, endpoint, **path_params)
+        else:
+            url = self.base_url + endpoint
         
-        # Process query parameters
-        query_params = {"iss.json": "extended", "iss.meta": "off"}
+        # Process query parameters (the shared base dict is only read, never mutated)
         if format_type:
             if not endpoint.endswith(f".{format_type}"):
                 url = f"{url}.{format_type}"
         if params:
-            query_params.update(build_query_params(params))
+            query_params = {**self.BASE_QUERY, **build_query_params(params)}
+        else:
+            query_params = self.BASE_QUERY
         
         # Set timeout
         timeout = timeout or self.timeout
         
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._send_request(url, query_params, method, timeout, headers)
+            except MoexRateLimitError as e:
+                if attempt == self.max_retries:
+                    raise
+                if e.retry_after is None:
+                    time.sleep(self._backoff_delay(attempt))
+            except MoexConnectionError:
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self._backoff_delay(attempt))
+            except MoexResponseError as e:
+                if e.status_code not in self.RETRY_STATUSES or attempt == self.max_retries:
+                    raise
+                time.sleep(self._backoff_delay(attempt))
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Computes the delay before a retry using exponential backoff with jitter.
+        
+        Args:
+            attempt: Zero-based number of the attempt that failed.
+        
+        Returns:
+            The delay in seconds.
+        """
+        return min(self.MAX_BACKOFF, self.base_backoff * 2 ** attempt) * random.uniform(0.5, 1.5)
+    
+    def _send_request(
+        self,
+        url: str,
+        query_params: Dict[str, str],
+        method: str,
+        timeout: Optional[int],
+        headers: Optional[Dict[str, str]],
+    ) -> requests.Response:
+        """
+        Sends a single HTTP request and maps error responses to exceptions.
+        
+        Args:
+            url: The complete request URL.
+            query_params: Query parameters (or form data for POST).
+            method: HTTP method (GET, POST, etc.).
+            timeout: Request timeout in seconds.
+            headers: Additional HTTP headers to send with the request.
+        
+        Returns:
+            The HTTP response object.
+        
+        Raises:
+            MoexConnectionError: If a connection error occurs.
+            MoexResponseError: If the API returns an error response.
+            MoexAuthError: If authentication fails.
+            MoexRateLimitError: If rate limits are exceeded.
+        """
+        # Enforce rate limiting
+        self._enforce_rate_limit()
+        
         try:
             # Make the request
             if method.upper() == "GET":
-                response = self.session.get(url, params=query_params, timeout=timeout)
+                response = self.session.get(url, params=query_params, timeout=timeout, headers=headers)
             elif method.upper() == "POST":
-                response = self.session.post(url, data=query_params, timeout=timeout)
+                response = self.session.post(url, data=query_params, timeout=timeout, headers=headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
-            # Record the request time for rate limiting
-            self.last_request_time = time.time()
-            
-            # Check for HTTP errors
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", "60"))
-                raise MoexRateLimitError(
-                    "Rate limit exceeded", 
-                    status_code=response.status_code,
-                    response=response,
-                    retry_after=retry_after
-                )
-            if response.status_code == 401 or response.status_code == 403:
-                raise MoexAuthError(
-                    "Authentication failed", 
-                    status_code=response.status_code, 
-                    response=response
-                )
-            if response.status_code >= 400:
+            # Check for HTTP errors (statuses with a dedicated exception are looked up in a table)
+            status_code = response.status_code
+            if status_code >= 400:
+                handler = self._STATUS_HANDLERS.get(status_code)
+                if handler:
+                    handler(self, response)
                 raise MoexResponseError(
-                    f"API returned error response: {response.status_code}", 
-                    status_code=response.status_code,
+                    f"API returned error response: {status_code}", 
+                    status_code=status_code,
                     response=response
                 )
             
+            self._on_success()
             return response
         
         except requests.exceptions.RequestException as e:
@@ -161,6 +410,52 @@ class MoexApiClient:
                 original_error=e
             )
     
+    def _raise_rate_limit_error(self, response: requests.Response):
+        """
+        Handles a 429 response by slowing down and raising MoexRateLimitError.
+        
+        Args:
+            response: The HTTP response object.
+        
+        Raises:
+            MoexRateLimitError: Always.
+        """
+        try:
+            retry_after = int(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            # No usable header (or an HTTP date): _make_request backs off instead
+            retry_after = None
+        self._on_rate_limited(retry_after or 0)
+        raise MoexRateLimitError(
+            "Rate limit exceeded", 
+            status_code=response.status_code,
+            response=response,
+            retry_after=retry_after
+        )
+    
+    def _raise_auth_error(self, response: requests.Response):
+        """
+        Handles a 401/403 response by raising MoexAuthError.
+        
+        Args:
+            response: The HTTP response object.
+        
+        Raises:
+            MoexAuthError: Always.
+        """
+        raise MoexAuthError(
+            "Authentication failed", 
+            status_code=response.status_code, 
+            response=response
+        )
+    
+    # Error statuses that map to a more specific exception than MoexResponseError
+    _STATUS_HANDLERS = {
+        429: _raise_rate_limit_error,
+        401: _raise_auth_error,
+        403: _raise_auth_error,
+    }
+    
     def get_json(
         self,
         endpoint: str,
@@ -194,12 +489,41 @@ class MoexApiClient:
             format_type="json",
         )
         
+        return self._decode_json(response)
+    
+    def _decode_json(self, response: requests.Response) -> Dict[str, Any]:
+        """
+        Decodes the JSON body of a response.
+        
+        The raw bytes are handed to the JSON parser directly, so the body is never
+        decoded to text (and its charset never guessed) on the success path. A body
+        declared as something other than JSON (e.g. an HTML error page) is rejected
+        without running the parser.
+        
+        Args:
+            response: The HTTP response object.
+        
+        Returns:
+            The parsed JSON response.
+        
+        Raises:
+            MoexParsingError: If the body is not valid JSON.
+        """
+        content = response.content
+        
+        content_type = response.headers.get("Content-Type", "")
+        if content_type and "json" not in content_type:
+            raise MoexParsingError(
+                f"Failed to parse JSON response: unexpected Content-Type '{content_type}'",
+                data=content[:self.ERROR_BODY_BYTES].decode("utf-8", errors="replace"),
+            )
+        
         try:
-            return response.json()
-        except json.JSONDecodeError as e:
+            return _json_loads(content)
+        except ValueError as e:
             raise MoexParsingError(
                 "Failed to parse JSON response", 
-                data=response.text,
+                data=content[:self.ERROR_BODY_BYTES].decode("utf-8", errors="replace"),
                 original_error=e
             )
     
@@ -260,7 +584,7 @@ class MoexApiClient:
             method: HTTP method (GET, POST, etc.).
             timeout: Request timeout in seconds.
             block_name: Specific data block to return (returns all blocks if None).
-            normalize: Whether to normalize the DataFrame columns (convert types).
+            normalize: Whether to build the columns listed in _BLOCK_DTYPES with their final dtypes.
         
         Returns:
             Either a single DataFrame or a dictionary of DataFrames for each data block.
@@ -268,7 +592,7 @@ class MoexApiClient:
         Raises:
             MoexApiError: If the request fails or the response is invalid.
         """
-        parsed_data = self.get_data(
+        json_response = self.get_json(
             endpoint=endpoint,
             params=params,
             path_params=path_params,
@@ -276,50 +600,307 @@ class MoexApiClient:
             timeout=timeout,
         )
         
-        result = response_to_dataframe(parsed_data, block_name)
+        return json_response_to_dataframe(
+            json_response, block_name, _BLOCK_DTYPES if normalize else None
+        )
+    
+    def _iter_pages(
+        self,
+        endpoint: str,
+        block_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        path_params: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Iterates over the pages of a paginated MOEX ISS data block.
+        
+        MOEX limits the number of rows returned per request and expects the
+        `start` parameter to be advanced to fetch the rest. When the first
+        response carries a `<block>.cursor` block (e.g. history), the total row
+        count is known up front and the remaining pages are fetched concurrently;
+        otherwise pages are requested one at a time until one comes back empty
+        (e.g. candles). Pages are yielded in order either way.
         
-        if normalize:
-            if isinstance(result, pd.DataFrame):
-                return normalize_dataframe(result)
-            else:
-                return {name: normalize_dataframe(df) for name, df in result.items()}
+        Args:
+            endpoint: The API endpoint path.
+            block_name: The data block to paginate over.
+            params: Query parameters for the request.
+            path_params: Parameters to be substituted in the endpoint path.
+        
+        Yields:
+            The raw data block of each page, with 'columns' and 'data' arrays.
+        
+        Raises:
+            MoexApiError: If a request fails or a response is invalid.
+        """
+        def fetch_page(start: int) -> Dict[str, Any]:
+            return self.get_json(
+                endpoint=endpoint,
+                params={**(params or {}), "start": start},
+                path_params=path_params,
+            )
+        
+        json_response = fetch_page(0)
+        block = json_response.get(block_name)
+        if not block or not block.get("data"):
+            return
+        yield block
+        
+        cursor = json_response.get(f"{block_name}.cursor")
+        if cursor and cursor.get("data"):
+            position = dict(zip(cursor["columns"], cursor["data"][0]))
+            starts = range(
+                position["INDEX"] + position["PAGESIZE"],
+                position["TOTAL"],
+                position["PAGESIZE"],
+            )
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                for json_response in executor.map(fetch_page, starts):
+                    block = json_response.get(block_name)
+                    if block and block.get("data"):
+                        yield block
+            return
+        
+        start = len(block["data"])
+        while True:
+            json_response = fetch_page(start)
+            block = json_response.get(block_name)
+            if not block or not block.get("data"):
+                return
+            yield block
+            start += len(block["data"])
+    
+    def get_paginated_dataframe(
+        self,
+        endpoint: str,
+        block_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        path_params: Optional[Dict[str, str]] = None,
+        normalize: bool = True,
+        cacheable: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Fetches every page of a MOEX ISS data block into a single DataFrame.
+        
+        Rows from all pages are accumulated and converted to a DataFrame once,
+        rather than building and concatenating a DataFrame per page.
+        
+        When cacheable is set and the client has a cache_dir, the result is
+        stored on disk and later calls with the same arguments load it from
+        there without any request. Only pass cacheable for data that can no
+        longer change, such as history for a date range that has ended.
+        
+        Args:
+            endpoint: The API endpoint path.
+            block_name: The data block to return.
+            params: Query parameters for the request.
+            path_params: Parameters to be substituted in the endpoint path.
+            normalize: Whether to build the columns listed in _BLOCK_DTYPES with their final dtypes.
+            cacheable: Whether the result may be cached on disk indefinitely.
+        
+        Returns:
+            A DataFrame with the rows of all pages.
+        
+        Raises:
+            MoexApiError: If a request fails or a response is invalid.
+        """
+        def fetch() -> pd.DataFrame:
+            columns = []
+            rows = []
+            for page in self._iter_pages(endpoint, block_name, params, path_params):
+                columns = page["columns"]
+                rows.extend(page["data"])
+            
+            dtypes = _BLOCK_DTYPES.get(block_name) if normalize else None
+            return block_to_dataframe(columns, rows, block_name, dtypes)
+        
+        if not cacheable:
+            return fetch()
+        return self._cached_dataframe(
+            fetch, endpoint, block_name, params, path_params, normalize
+        )
+    
+    def _cached_dataframe(
+        self,
+        fetch: Callable[[], pd.DataFrame],
+        endpoint: str,
+        block_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        path_params: Optional[Dict[str, str]] = None,
+        normalize: bool = True,
+        ttl: Optional[float] = None,
+    ) -> pd.DataFrame:
+        """
+        Returns the result of fetch, reusing a copy stored in cache_dir when possible.
+        
+        A cached file is used while it is younger than ttl seconds (by modification
+        time), or indefinitely if ttl is None. Without a cache_dir, fetch is always
+        called. Files are written to a temporary name and renamed into place, so a
+        concurrent reader never sees a partial file.
+        
+        Args:
+            fetch: Callable that requests and builds the DataFrame.
+            endpoint: The API endpoint path.
+            block_name: The data block to return.
+            params: Query parameters for the request.
+            path_params: Parameters to be substituted in the endpoint path.
+            normalize: Whether the DataFrame is normalized.
+            ttl: Seconds a cached result stays valid (None keeps it indefinitely).
+        
+        Returns:
+            The cached or freshly fetched DataFrame.
+        
+        Raises:
+            MoexApiError: If fetching fails.
+        """
+        if not self.cache_dir:
+            return fetch()
+        
+        cache_path = self._cache_path(endpoint, block_name, params, path_params, normalize)
+        try:
+            if ttl is None or time.time() - cache_path.stat().st_mtime < ttl:
+                return pd.read_pickle(cache_path)
+        except FileNotFoundError:
+            pass
+        
+        result = fetch()
+        
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+        result.to_pickle(temp_path)
+        os.replace(temp_path, cache_path)
         
         return result
     
+    def _cache_path(
+        self,
+        endpoint: str,
+        block_name: str,
+        params: Optional[Dict[str, Any]],
+        path_params: Optional[Dict[str, str]],
+        normalize: bool,
+    ) -> pathlib.Path:
+        """
+        Builds the disk cache file path for a request.
+        
+        The file name is a digest of everything that determines the result, so it
+        is stable across processes (unlike hash(), which is salted per process).
+        
+        Args:
+            endpoint: The API endpoint path.
+            block_name: The data block to return.
+            params: Query parameters for the request.
+            path_params: Parameters to be substituted in the endpoint path.
+            normalize: Whether the DataFrame is normalized.
+        
+        Returns:
+            The path of the pickle file inside cache_dir.
+        """
+        key = json.dumps(
+            [
+                endpoint,
+                block_name,
+                sorted(build_query_params(params or {}).items()),
+                sorted((path_params or {}).items()),
+                normalize,
+            ],
+            default=str,
+        )
+        return self.cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.pkl"
+    
+    def _get_reference_dataframe(self, endpoint: str, block_name: str) -> pd.DataFrame:
+        """
+        Gets a rarely changing reference listing, reusing a cached copy when possible.
+        
+        Listings are kept for REFERENCE_TTL seconds. Once a listing expires it is
+        revalidated with If-None-Match when the server supplied an ETag, and a
+        304 Not Modified response reuses the cached DataFrame without parsing.
+        
+        Args:
+            endpoint: The API endpoint path (with path parameters substituted).
+            block_name: The data block to return.
+        
+        Returns:
+            A copy of the DataFrame for the requested block.
+        
+        Raises:
+            MoexApiError: If the request fails or the response is invalid.
+        """
+        now = time.monotonic()
+        cached = self._reference_cache.get(endpoint)
+        if cached and now < cached[0]:
+            return cached[1].copy()
+        
+        headers = {"If-None-Match": cached[2]} if cached and cached[2] else None
+        response = self._make_request(endpoint=endpoint, format_type="json", headers=headers)
+        
+        if response.status_code == 304 and cached:
+            df, etag = cached[1], cached[2]
+        else:
+            json_response = self._decode_json(response)
+            df = json_response_to_dataframe(json_response, block_name, _BLOCK_DTYPES)
+            etag = response.headers.get("ETag")
+        
+        self._reference_cache[endpoint] = (now + self.REFERENCE_TTL, df, etag)
+        return df.copy()
+    
+    def _fetch_many(
+        self,
+        fetch: Callable[[Any], pd.DataFrame],
+        keys: List[Any],
+        max_workers: Optional[int] = None,
+    ) -> Dict[Any, pd.DataFrame]:
+        """
+        Calls a single-key fetch method for several keys from a thread pool.
+        
+        Args:
+            fetch: Function fetching the DataFrame for one key.
+            keys: The keys (security or index IDs, board specs) to fetch.
+            max_workers: Maximum number of concurrent requests (defaults to MAX_WORKERS).
+        
+        Returns:
+            A dictionary mapping each key to its DataFrame, in the order of keys.
+        
+        Raises:
+            MoexApiError: If any of the requests fails.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or self.MAX_WORKERS) as executor:
+            futures = {key: executor.submit(fetch, key) for key in keys}
+            return {key: future.result() for key, future in futures.items()}
+    
     # --- API Endpoints ---
     
     def get_engines(self) -> pd.DataFrame:
         """
         Gets a list of trading engines available on MOEX.
         
+        The listing is cached for REFERENCE_TTL seconds (see _get_reference_dataframe).
+        
         Returns:
             A DataFrame with information about trading engines.
         """
-        return self.get_dataframe(
-            endpoint="/engines",
-            block_name="engines",
-        )
+        return self._get_reference_dataframe(_ENDPOINTS["engines"], "engines")
     
     def get_markets(self, engine: str) -> pd.DataFrame:
         """
         Gets a list of markets for a specific trading engine.
         
+        The listing is cached for REFERENCE_TTL seconds (see _get_reference_dataframe).
+        
         Args:
             engine: Trading engine ID (e.g., 'stock', 'futures', 'currency').
             
         Returns:
             A DataFrame with information about available markets within the specified engine.
         """
-        return self.get_dataframe(
-            endpoint="/engines/[engine]/markets",
-            path_params={"engine": engine},
-            block_name="markets",
-        )
+        return self._get_reference_dataframe(_ENDPOINTS["markets"].format(engine=engine), "markets")
     
     def get_boards(self, engine: str, market: str) -> pd.DataFrame:
         """
         Gets trading boards for a specific market.
         
+        The listing is cached for REFERENCE_TTL seconds (see _get_reference_dataframe).
+        
         Args:
             engine: Trading engine ID (e.g., 'stock', 'futures').
             market: Market ID (e.g., 'shares', 'bonds', 'index').
@@ -327,11 +908,7 @@ class MoexApiClient:
         Returns:
             A DataFrame with information about trading boards.
         """
-        return self.get_dataframe(
-            endpoint="/engines/[engine]/markets/[market]/boards",
-            path_params={"engine": engine, "market": market},
-            block_name="boards",
-        )
+        return self._get_reference_dataframe(_ENDPOINTS["boards"].format(engine=engine, market=market), "boards")
     
     def get_securities(
         self,
@@ -348,6 +925,8 @@ class MoexApiClient:
         - Securities within a specific engine/market/board combination
         - Securities matching a search query
         
+        With a cache_dir, listings are reused from disk for SECURITIES_TTL seconds.
+        
         Args:
             engine: Trading engine ID (optional).
             market: Market ID (optional, requires engine).
@@ -360,29 +939,59 @@ class MoexApiClient:
         if query:
             # Search for securities by name/code
             params = {"q": query}
-            endpoint = "/securities"
+            endpoint = _ENDPOINTS["securities"]
             path_params = {}
         elif engine and market and board:
             # Get securities for a specific board
-            endpoint = "/engines/[engine]/markets/[market]/boards/[board]/securities"
+            endpoint = _ENDPOINTS["board_securities"]
             path_params = {"engine": engine, "market": market, "board": board}
             params = {}
         elif engine and market:
             # Get securities for a specific market
-            endpoint = "/engines/[engine]/markets/[market]/securities"
+            endpoint = _ENDPOINTS["market_securities"]
             path_params = {"engine": engine, "market": market}
             params = {}
         else:
             # Get all securities
-            endpoint = "/securities"
+            endpoint = _ENDPOINTS["securities"]
             path_params = {}
             params = {}
         
-        return self.get_dataframe(
-            endpoint=endpoint,
-            path_params=path_params,
-            params=params,
-            block_name="securities",
+        endpoint = endpoint.format_map(path_params)
+        return self._cached_dataframe(
+            lambda: self.get_dataframe(endpoint=endpoint, params=params, block_name="securities"),
+            endpoint,
+            "securities",
+            params,
+            ttl=self.SECURITIES_TTL,
+        )
+    
+    def get_many_securities(
+        self,
+        specs: List[Tuple[str, str, str]],
+        max_workers: Optional[int] = None,
+    ) -> Dict[Tuple[str, str, str], pd.DataFrame]:
+        """
+        Gets the securities listings of several boards concurrently.
+        
+        Requests are issued from a thread pool so that their network round-trips
+        overlap; the client's rate limit still applies across all threads.
+        
+        Args:
+            specs: (engine, market, board) tuples, e.g. [('stock', 'shares', 'TQBR')].
+            max_workers: Maximum number of concurrent requests (defaults to MAX_WORKERS).
+            
+        Returns:
+            A dictionary mapping each (engine, market, board) tuple to a DataFrame
+            with the securities of that board.
+            
+        Raises:
+            MoexApiError: If any of the requests fails.
+        """
+        return self._fetch_many(
+            lambda spec: self.get_securities(*spec),
+            [tuple(spec) for spec in specs],
+            max_workers,
         )
     
     def get_security_info(self, security_id: str) -> Dict[str, pd.DataFrame]:
@@ -397,8 +1006,7 @@ class MoexApiClient:
             boards where it's traded, and other related data.
         """
         return self.get_dataframe(
-            endpoint="/securities/[security]",
-            path_params={"security": security_id},
+            endpoint=_ENDPOINTS["security"].format(security=security_id),
         )
     
     def get_market_data(
@@ -424,7 +1032,7 @@ class MoexApiClient:
             A DataFrame with current market data.
         """
         if engine and market and board:
-            endpoint = "/engines/[engine]/markets/[market]/boards/[board]/securities/[security]"
+            endpoint = _ENDPOINTS["board_security"]
             path_params = {
                 "engine": engine,
                 "market": market,
@@ -433,15 +1041,80 @@ class MoexApiClient:
             }
         else:
             # Try to get market data without specifying engine/market/board
-            endpoint = "/securities/[security]/marketdata"
+            endpoint = _ENDPOINTS["security_marketdata"]
             path_params = {"security": security_id}
         
         return self.get_dataframe(
-            endpoint=endpoint,
-            path_params=path_params,
+            endpoint=endpoint.format_map(path_params),
             block_name="marketdata",
         )
     
+    def get_many_market_data(
+        self,
+        security_ids: List[str],
+        engine: Optional[str] = None,
+        market: Optional[str] = None,
+        board: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Gets current market data for several securities concurrently.
+        
+        Requests are issued from a thread pool so that their network round-trips
+        overlap; the client's rate limit still applies across all threads.
+        
+        Args:
+            security_ids: The security IDs (tickers).
+            engine: Trading engine ID (optional for some securities).
+            market: Market ID (optional for some securities).
+            board: Board ID (optional for some securities).
+            max_workers: Maximum number of concurrent requests (defaults to MAX_WORKERS).
+            
+        Returns:
+            A dictionary mapping each security ID to a DataFrame with its market data.
+            
+        Raises:
+            MoexApiError: If any of the requests fails.
+        """
+        return self._fetch_many(
+            lambda security_id: self.get_market_data(security_id, engine, market, board),
+            security_ids,
+            max_workers,
+        )
+    
+    def get_board_market_data(
+        self,
+        engine: str,
+        market: str,
+        board: str,
+        with_securities: bool = False,
+    ) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+        """
+        Gets current market data for all securities on a board in a single request.
+        
+        This is much cheaper than requesting market data per security when many
+        securities of the same board are needed.
+        
+        Args:
+            engine: Trading engine ID.
+            market: Market ID.
+            board: Board ID.
+            with_securities: Whether to also return the securities listing from the same response.
+            
+        Returns:
+            A DataFrame with one row of market data per security, or if with_securities
+            is set, a dictionary with 'securities' and 'marketdata' DataFrames.
+        """
+        blocks = ["securities", "marketdata"] if with_securities else ["marketdata"]
+        response = self.get_dataframe(
+            endpoint=_ENDPOINTS["board_securities"].format(engine=engine, market=market, board=board),
+            params={"iss.only": ",".join(blocks)},
+        )
+        
+        if with_securities:
+            return {name: response.get(name, pd.DataFrame()) for name in blocks}
+        return response.get("marketdata", pd.DataFrame())
+    
     def get_orderbook(
         self,
         security_id: str,
@@ -464,13 +1137,12 @@ class MoexApiClient:
             A DataFrame with bid and ask orders at different price levels.
         """
         return self.get_dataframe(
-            endpoint="/engines/[engine]/markets/[market]/boards/[board]/securities/[security]/orderbook",
-            path_params={
-                "engine": engine,
-                "market": market,
-                "board": board,
-                "security": security_id
-            },
+            endpoint=_ENDPOINTS["orderbook"].format(
+                engine=engine,
+                market=market,
+                board=board,
+                security=security_id,
+            ),
             params={"depth": depth},
             block_name="orderbook",
         )
@@ -497,7 +1169,7 @@ class MoexApiClient:
             A DataFrame with recent trades.
         """
         if board:
-            endpoint = "/engines/[engine]/markets/[market]/boards/[board]/securities/[security]/trades"
+            endpoint = _ENDPOINTS["board_trades"]
             path_params = {
                 "engine": engine,
                 "market": market,
@@ -505,7 +1177,7 @@ class MoexApiClient:
                 "security": security_id
             }
         else:
-            endpoint = "/engines/[engine]/markets/[market]/securities/[security]/trades"
+            endpoint = _ENDPOINTS["market_trades"]
             path_params = {
                 "engine": engine,
                 "market": market,
@@ -513,8 +1185,7 @@ class MoexApiClient:
             }
         
         return self.get_dataframe(
-            endpoint=endpoint,
-            path_params=path_params,
+            endpoint=endpoint.format_map(path_params),
             params={"limit": limit},
             block_name="trades",
         )
@@ -529,6 +1200,7 @@ class MoexApiClient:
         end_date: Optional[Union[str, datetime.date, datetime.datetime]] = None,
         board: Optional[str] = None,
         board_group: Optional[str] = None,
+        columns: Optional[List[str]] = None,
     ) -> pd.DataFrame:
         """
         Gets historical candles (OHLCV) for a specific security.
@@ -549,9 +1221,10 @@ class MoexApiClient:
             end_date: End date for data range.
             board: Board ID (optional - one of board or board_group must be provided).
             board_group: Board group ID (optional - one of board or board_group must be provided).
+            columns: Specific columns to request (optional, all columns if None).
             
         Returns:
-            A DataFrame with candle data (open, high, low, close, volume).
+            A DataFrame with candle data (open, high, low, close, volume) for all pages.
             
         Raises:
             ValueError: If neither board nor board_group is provided.
@@ -563,15 +1236,20 @@ class MoexApiClient:
         else:
             date_params = {}
         
-        # Build common parameters
+        # Build common parameters (only the candles block is needed)
         params = {
             "interval": interval,
+            "iss.only": "candles",
             **date_params
         }
         
+        # Let the server drop unrequested columns from the payload
+        if columns:
+            params["candles.columns"] = columns
+        
         # Determine the endpoint based on board or board_group
         if board:
-            endpoint = "/engines/[engine]/markets/[market]/boards/[board]/securities/[security]/candles"
+            endpoint = _ENDPOINTS["board_candles"]
             path_params = {
                 "engine": engine,
                 "market": market,
@@ -579,7 +1257,7 @@ class MoexApiClient:
                 "security": security_id
             }
         elif board_group:
-            endpoint = "/engines/[engine]/markets/[market]/boardgroups/[boardgroup]/securities/[security]/candles"
+            endpoint = _ENDPOINTS["boardgroup_candles"]
             path_params = {
                 "engine": engine,
                 "market": market,
@@ -588,18 +1266,21 @@ class MoexApiClient:
             }
         else:
             # Use default endpoint for the security
-            endpoint = "/engines/[engine]/markets/[market]/securities/[security]/candles"
+            endpoint = _ENDPOINTS["market_candles"]
             path_params = {
                 "engine": engine,
                 "market": market,
                 "security": security_id
             }
         
-        return self.get_dataframe(
-            endpoint=endpoint,
-            path_params=path_params,
+        # Data for a date range that ended before today no longer changes
+        closed_range = bool(end_date) and date_params["till"] < datetime.date.today().isoformat()
+        
+        return self.get_paginated_dataframe(
+            endpoint=endpoint.format_map(path_params),
             params=params,
             block_name="candles",
+            cacheable=closed_range,
         )
     
     def get_market_history(
@@ -624,10 +1305,10 @@ class MoexApiClient:
             start_date: Start date for data range.
             end_date: End date for data range.
             board: Board ID (optional).
-            columns: Specific columns to request (optional).
+            columns: Specific columns to request (optional, all columns if None).
             
         Returns:
-            A DataFrame with historical trading data.
+            A DataFrame with historical trading data for all pages.
         """
         # Validate date range (if provided)
         if start_date or end_date:
@@ -636,16 +1317,16 @@ class MoexApiClient:
         else:
             date_params = {}
         
-        # Build common parameters
-        params = date_params.copy()
+        # Build common parameters (only the history block and its pagination cursor are needed)
+        params = {"iss.only": "history,history.cursor", **date_params}
         
-        # Add columns parameter if provided
+        # Let the server drop unrequested columns from the payload
         if columns:
-            params["columns"] = columns
+            params["history.columns"] = columns
         
         # Determine the endpoint based on whether board is provided
         if board:
-            endpoint = "/history/engines/[engine]/markets/[market]/boards/[board]/securities/[security]"
+            endpoint = _ENDPOINTS["board_history"]
             path_params = {
                 "engine": engine,
                 "market": market,
@@ -653,18 +1334,21 @@ class MoexApiClient:
                 "security": security_id
             }
         else:
-            endpoint = "/history/engines/[engine]/markets/[market]/securities/[security]"
+            endpoint = _ENDPOINTS["market_history"]
             path_params = {
                 "engine": engine,
                 "market": market,
                 "security": security_id
             }
         
-        return self.get_dataframe(
-            endpoint=endpoint,
-            path_params=path_params,
+        # Data for a date range that ended before today no longer changes
+        closed_range = bool(end_date) and date_params["till"] < datetime.date.today().isoformat()
+        
+        return self.get_paginated_dataframe(
+            endpoint=endpoint.format_map(path_params),
             params=params,
             block_name="history",
+            cacheable=closed_range,
         )
     
     def get_board_history(
@@ -690,7 +1374,7 @@ class MoexApiClient:
         if date:
             params["date"] = format_date(date)
         
-        endpoint = "/history/engines/[engine]/markets/[market]/boards/[board]/securities"
+        endpoint = _ENDPOINTS["board_history_all"]
         path_params = {
             "engine": engine,
             "market": market,
@@ -698,8 +1382,7 @@ class MoexApiClient:
         }
         
         return self.get_dataframe(
-            endpoint=endpoint,
-            path_params=path_params,
+            endpoint=endpoint.format_map(path_params),
             params=params,
             block_name="history",
         )
@@ -708,26 +1391,75 @@ class MoexApiClient:
         """
         Gets a list of indices calculated by MOEX.
         
+        The listing is cached for REFERENCE_TTL seconds (see _get_reference_dataframe).
+        
         Returns:
             A DataFrame with index information.
         """
-        return self.get_dataframe(
-            endpoint="/statistics/engines/stock/markets/index/analytics",
-            block_name="indices",
-        )
+        return self._get_reference_dataframe(_ENDPOINTS["indices"], "indices")
     
     def get_index_components(self, index_id: str) -> pd.DataFrame:
         """
         Gets the components (constituents) of a specific MOEX index.
         
+        With a cache_dir, components are reused from disk for INDEX_COMPONENTS_TTL seconds.
+        
         Args:
             index_id: The index ID (e.g., 'IMOEX', 'RTSI').
             
         Returns:
             A DataFrame with index component securities and their weights.
         """
-        return self.get_dataframe(
-            endpoint="/statistics/engines/stock/markets/index/analytics/[indexid]/tickers",
-            path_params={"indexid": index_id},
-            block_name="tickers",
-        )
\ No newline at end of file
+        endpoint = _ENDPOINTS["index_tickers"].format(indexid=index_id)
+        return self._cached_dataframe(
+            lambda: self.get_dataframe(endpoint=endpoint, block_name="tickers"),
+            endpoint,
+            "tickers",
+            ttl=self.INDEX_COMPONENTS_TTL,
+        )
+    
+    def get_many_index_components(
+        self,
+        index_ids: List[str],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Gets the components of several MOEX indices concurrently.
+        
+        Requests are issued from a thread pool so that their network round-trips
+        overlap; the client's rate limit still applies across all threads.
+        
+        Args:
+            index_ids: The index IDs (e.g., ['IMOEX', 'RTSI']).
+            max_workers: Maximum number of concurrent requests (defaults to MAX_WORKERS).
+            
+        Returns:
+            A dictionary mapping each index ID to a DataFrame with its components.
+            
+        Raises:
+            MoexApiError: If any of the requests fails.
+        """
+        return self._fetch_many(self.get_index_components, index_ids, max_workers)
+
+
+_default_client: Optional[MoexApiClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> MoexApiClient:
+    """
+    Returns a MoexApiClient shared by the whole process, creating it on first use.
+    
+    A client keeps its HTTP connections open between requests, so scripts that
+    call the endpoint functions ad hoc should pass this shared client instead of
+    creating a new MoexApiClient for every call.
+    
+    Returns:
+        The shared MoexApiClient instance.
+    """
+    global _default_client
+    
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = MoexApiClient()
+        return _default_client
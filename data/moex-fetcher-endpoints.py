@@ -6,14 +6,34 @@ to offer more targeted data retrieval operations with simplified interfaces.
 """
 
 import datetime
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Union, Any, Tuple
 
+import numpy as np
 import pandas as pd
 
 from .client import MoexApiClient
 from .exceptions import MoexApiError
 from .utils import format_date, validate_date_range
 
+logger = logging.getLogger(__name__)
+
+# Map human-readable interval names to API interval codes
+_INTERVAL_MAP = {
+    "min": 1, "1min": 1,
+    "10min": 10,
+    "hour": 60,
+    "day": 24,
+    "week": 7,
+    "month": 31,
+    "quarter": 4,
+}
+_VALID_INTERVALS = ", ".join(_INTERVAL_MAP)
+
+# Snapshots of at least this many tickers use one board-level request
+_BOARD_SNAPSHOT_MIN_TICKERS = 10
+
 
 def get_stock_securities(client: MoexApiClient, board: str = "TQBR") -> pd.DataFrame:
     """
@@ -124,25 +144,13 @@ def get_stock_candles(
     Raises:
         ValueError: If the interval name is not recognized.
     """
-    # Map human-readable interval names to API interval codes
-    interval_map = {
-        "min": 1, "1min": 1,
-        "10min": 10,
-        "hour": 60,
-        "day": 24,
-        "week": 7,
-        "month": 31,
-        "quarter": 4,
-    }
-    
-    if interval not in interval_map:
+    interval_code = _INTERVAL_MAP.get(interval)
+    if interval_code is None:
         raise ValueError(
             f"Invalid interval: '{interval}'. "
-            f"Valid intervals are: {', '.join(interval_map.keys())}"
+            f"Valid intervals are: {_VALID_INTERVALS}"
         )
     
-    interval_code = interval_map[interval]
-    
     return client.get_candles(
         security_id=ticker,
         engine="stock",
@@ -182,20 +190,24 @@ def find_security(
     
     Args:
         client: An initialized MoexApiClient.
-        query: Search query string.
+        query: Search query string (matched literally, not as a regular expression).
         engine: Optional filter by engine ID.
         market: Optional filter by market ID (requires engine to be specified).
         
     Returns:
         A DataFrame with matching securities.
     """
+    if not query.strip():
+        # An empty query matches everything, so return the listing without searching
+        return client.get_securities(engine=engine, market=market)
+    
     if engine and market:
         # Search within a specific engine and market
         securities = client.get_securities(engine=engine, market=market)
-        # Filter by query (case-insensitive search in ticker or name)
+        # Filter by query (case-insensitive substring search in ticker or name)
         return securities[
-            securities["SECID"].str.contains(query, case=False) |
-            securities["SHORTNAME"].str.contains(query, case=False)
+            securities["SECID"].str.contains(query, case=False, regex=False, na=False) |
+            securities["SHORTNAME"].str.contains(query, case=False, regex=False, na=False)
         ]
     else:
         # General search using the API's search endpoint
@@ -208,42 +220,65 @@ def get_market_data_snapshot(
     board: str = "TQBR",
     engine: str = "stock",
     market: str = "shares",
+    max_workers: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     Gets current market data for multiple securities in a single DataFrame.
     
+    For _BOARD_SNAPSHOT_MIN_TICKERS or more tickers, market data for the whole
+    board is fetched in a single request and filtered to the requested tickers;
+    if that request fails, the per-ticker requests are used instead. Otherwise
+    the per-ticker requests are issued from a thread pool so that their
+    network round-trips overlap; the client's rate limit still applies to all of them.
+    
     Args:
         client: An initialized MoexApiClient.
         tickers: List of security ticker symbols.
         board: Board ID (defaults to TQBR, the main stock board).
         engine: Trading engine ID (defaults to 'stock').
         market: Market ID (defaults to 'shares').
+        max_workers: Maximum number of concurrent requests (defaults to the client's MAX_WORKERS).
         
     Returns:
-        A DataFrame with current market data for all requested securities.
+        A DataFrame with current market data for all requested securities, in the
+        order of tickers (a ticker listed twice appears twice).
     """
-    # Create an empty list to store data for each ticker
+    if len(tickers) >= _BOARD_SNAPSHOT_MIN_TICKERS:
+        try:
+            return _get_board_market_data_snapshot(client, tickers, board, engine, market)
+        except MoexApiError as e:
+            logger.warning(
+                "Error fetching market data for board %s, fetching per ticker: %s", board, e
+            )
+    
+    # Create lists to store data for each ticker and the tickers that returned it
     all_data = []
+    fetched_tickers = []
     
-    # Fetch data for each ticker
-    for ticker in tickers:
-        try:
-            ticker_data = client.get_market_data(
+    # Fetch data for all tickers concurrently
+    with ThreadPoolExecutor(max_workers=max_workers or client.MAX_WORKERS) as executor:
+        # A list of pairs rather than a dict, so repeated tickers are kept
+        futures = [
+            (ticker, executor.submit(
+                client.get_market_data,
                 security_id=ticker,
                 engine=engine,
                 market=market,
                 board=board,
-            )
-            
-            # Add the ticker to identify rows
-            ticker_data["TICKER"] = ticker
-            
+            ))
+            for ticker in tickers
+        ]
+    
+    # Collect results in ticker order
+    for ticker, future in futures:
+        try:
             # Append to the list
-            all_data.append(ticker_data)
+            all_data.append(future.result())
+            fetched_tickers.append(ticker)
         
         except MoexApiError as e:
             # Skip tickers that return errors
-            print(f"Error fetching data for {ticker}: {str(e)}")
+            logger.warning("Error fetching data for %s: %s", ticker, e)
             continue
     
     # Combine all data into a single DataFrame
@@ -251,7 +286,60 @@ def get_market_data_snapshot(
         # Return empty DataFrame with appropriate columns if no data was fetched
         return pd.DataFrame(columns=["TICKER", "LAST", "CHANGE", "VOLTODAY", "OPEN", "LOW", "HIGH"])
     
-    return pd.concat(all_data, ignore_index=True)
+    result = pd.concat(all_data, ignore_index=True)
+    
+    # Add the ticker to identify rows, in one assignment for all frames
+    result["TICKER"] = np.repeat(fetched_tickers, [len(df) for df in all_data])
+    
+    return result
+
+
+def _get_board_market_data_snapshot(
+    client: MoexApiClient,
+    tickers: List[str],
+    board: str,
+    engine: str,
+    market: str,
+) -> pd.DataFrame:
+    """
+    Gets current market data for the given tickers from a single board-level request.
+    
+    Args:
+        client: An initialized MoexApiClient.
+        tickers: List of security ticker symbols.
+        board: Board ID.
+        engine: Trading engine ID.
+        market: Market ID.
+        
+    Returns:
+        A DataFrame with current market data for the requested securities, in ticker order.
+    
+    Raises:
+        MoexApiError: If the board request fails.
+    """
+    market_data = client.get_board_market_data(engine=engine, market=market, board=board)
+    
+    if market_data.empty:
+        logger.warning("No market data on board %s for: %s", board, ", ".join(tickers))
+        return pd.DataFrame(columns=["TICKER", "LAST", "CHANGE", "VOLTODAY", "OPEN", "LOW", "HIGH"])
+    
+    # Keep the requested tickers in the order (and multiplicity) they were requested;
+    # an inner merge preserves the order of the left keys
+    result = pd.DataFrame({"TICKER": tickers}).merge(
+        market_data, left_on="TICKER", right_on="SECID", how="inner", sort=False
+    )
+    result = result[[*market_data.columns, "TICKER"]]
+    
+    # Report tickers the board did not list, as the per-ticker path does for failures
+    missing = set(tickers) - set(result["SECID"])
+    if missing:
+        logger.warning(
+            "No market data on board %s for: %s",
+            board,
+            ", ".join(ticker for ticker in tickers if ticker in missing),
+        )
+    
+    return result
 
 
 def get_board_securities_with_market_data(
@@ -264,6 +352,7 @@ def get_board_securities_with_market_data(
     Gets a list of securities on a board with their current market data.
     
     This function combines security listing and market data in a single DataFrame.
+    Both come from the same board-level request.
     
     Args:
         client: An initialized MoexApiClient.
@@ -274,36 +363,25 @@ def get_board_securities_with_market_data(
     Returns:
         A DataFrame with securities and their current market data.
     """
-    # Get securities list
-    securities = client.get_securities(engine=engine, market=market, board=board)
-    
-    # Extract just the ticker column for use in market data query
-    tickers = securities["SECID"].tolist()
-    
-    # Get market data for these tickers
-    market_data = get_market_data_snapshot(
-        client=client,
-        tickers=tickers,
-        board=board,
-        engine=engine,
-        market=market,
+    # Get the securities list and market data for the whole board at once
+    blocks = client.get_board_market_data(
+        engine=engine, market=market, board=board, with_securities=True
     )
+    securities = blocks["securities"]
+    market_data = blocks["marketdata"]
     
-    # Merge securities info with market data
+    # Merge securities info with market data (each security has a single market data row)
     if not market_data.empty:
-        result = pd.merge(
+        # Keep columns present in both blocks (e.g. BOARDID) from the securities listing
+        shared_columns = securities.columns.intersection(market_data.columns).drop("SECID")
+        return pd.merge(
             securities,
-            market_data,
-            left_on="SECID",
-            right_on="TICKER",
+            market_data.drop(columns=shared_columns),
+            on="SECID",
             how="left",
+            validate="one_to_one",
+            sort=False,
         )
-        
-        # Drop the duplicate ticker column
-        if "TICKER" in result.columns:
-            result = result.drop(columns=["TICKER"])
-        
-        return result
     
     return securities
 
@@ -315,10 +393,14 @@ def get_multi_timeframe_candles(
     start_date: Optional[Union[str, datetime.date, datetime.datetime]] = None,
     end_date: Optional[Union[str, datetime.date, datetime.datetime]] = None,
     board: str = "TQBR",
+    max_workers: Optional[int] = None,
 ) -> Dict[str, pd.DataFrame]:
     """
     Gets candles for multiple timeframes for a single security.
     
+    The timeframes are fetched from a thread pool so that their requests
+    overlap; the client's rate limit still applies to all of them.
+    
     Args:
         client: An initialized MoexApiClient.
         ticker: The security ticker symbol.
@@ -326,15 +408,18 @@ def get_multi_timeframe_candles(
         start_date: Start date for the data range.
         end_date: End date for the data range.
         board: Board ID (defaults to TQBR, the main stock board).
+        max_workers: Maximum number of concurrent requests (defaults to the client's MAX_WORKERS).
         
     Returns:
         A dictionary mapping interval names to DataFrames with candle data.
     """
     result = {}
     
-    for interval in intervals:
-        try:
-            candles = get_stock_candles(
+    # Fetch all timeframes concurrently
+    with ThreadPoolExecutor(max_workers=max_workers or client.MAX_WORKERS) as executor:
+        futures = {
+            interval: executor.submit(
+                get_stock_candles,
                 client=client,
                 ticker=ticker,
                 interval=interval,
@@ -342,17 +427,22 @@ def get_multi_timeframe_candles(
                 end_date=end_date,
                 board=board,
             )
-            
-            result[interval] = candles
+            for interval in intervals
+        }
+    
+    # Collect results in interval order
+    for interval, future in futures.items():
+        try:
+            result[interval] = future.result()
         
         except ValueError as e:
             # Skip invalid intervals
-            print(f"Error with interval '{interval}': {str(e)}")
+            logger.warning("Error with interval '%s': %s", interval, e)
             continue
         
         except MoexApiError as e:
             # Skip intervals that fail with API errors
-            print(f"API error for interval '{interval}': {str(e)}")
+            logger.warning("API error for interval '%s': %s", interval, e)
             continue
     
     return result
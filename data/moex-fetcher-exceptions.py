@@ -13,8 +13,13 @@ class MoexApiError(Exception):
         self.status_code = status_code
         self.response = response
         super().__init__(self.message)
+        # Formatted once, as errors may be logged many times (e.g. per ticker)
+        self._formatted = self._format()
         
     def __str__(self):
+        return self._formatted
+    
+    def _format(self):
         if self.status_code:
             return f"{self.message} (Status code: {self.status_code})"
         return self.message
@@ -28,7 +33,7 @@ class MoexConnectionError(MoexApiError):
         self.original_error = original_error
         super().__init__(message)
         
-    def __str__(self):
+    def _format(self):
         if self.original_error:
             return f"{self.message}: {str(self.original_error)}"
         return self.message
@@ -58,10 +63,10 @@ class MoexRateLimitError(MoexApiError):
         self.retry_after = retry_after
         super().__init__(message, status_code, response)
         
-    def __str__(self):
+    def _format(self):
         if self.retry_after:
             return f"{self.message} (Retry after: {self.retry_after} seconds)"
-        return super().__str__()
+        return super()._format()
 
 
 class MoexParsingError(MoexApiError):
@@ -73,7 +78,7 @@ class MoexParsingError(MoexApiError):
         self.original_error = original_error
         super().__init__(message)
         
-    def __str__(self):
+    def _format(self):
         if self.original_error:
             return f"{self.message}: {str(self.original_error)}"
         return self.message
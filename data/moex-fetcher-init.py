@@ -13,11 +13,16 @@ Usage:
 
     # Get securities listing
     securities = client.get_securities()
+
+A client keeps its HTTP connections open (and compressed) between requests, so
+create one client and reuse it for all calls, including the functions in
+moex_fetcher.endpoints. get_default_client() returns a client shared by the
+whole process.
 """
 
 __version__ = "0.1.0"
 
-from .client import MoexApiClient
+from .client import MoexApiClient, get_default_client
 from .exceptions import (
     MoexApiError,
     MoexConnectionError,
@@ -27,6 +32,7 @@ from .exceptions import (
 
 __all__ = [
     "MoexApiClient",
+    "get_default_client",
     "MoexApiError",
     "MoexConnectionError",
     "MoexResponseError",
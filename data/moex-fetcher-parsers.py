@@ -13,6 +13,10 @@ import pandas as pd
 
 from .exceptions import MoexParsingError
 
+# Limits for converting string columns to category in detect_and_convert_types
+_MAX_CATEGORIES = 1024  # Most distinct values in a categorical column
+_MAX_CATEGORY_RATIO = 0.5  # Most distinct values as a fraction of the rows
+
 
 def parse_json_response(response_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
     """
@@ -21,6 +25,8 @@ def parse_json_response(response_data: Dict[str, Any]) -> Dict[str, List[Dict[st
     The MOEX ISS API returns data in a specific format with multiple data blocks. 
     Each block has 'columns' defining field names and 'data' containing row values.
     This function transforms that structure into a more usable dictionary of lists.
+    To build DataFrames, use json_response_to_dataframe instead, which skips the
+    per-row dictionaries.
     
     Args:
         response_data: The JSON response from the API.
@@ -43,19 +49,10 @@ def parse_json_response(response_data: Dict[str, Any]) -> Dict[str, List[Dict[st
             columns = block_content['columns']
             data = block_content['data']
             
-            # Transform rows into dictionaries
-            rows = []
-            for row in data:
-                if len(row) != len(columns):
-                    raise MoexParsingError(
-                        f"Column count mismatch in block '{block_name}': "
-                        f"{len(columns)} columns defined but row has {len(row)} values"
-                    )
-                
-                row_dict = dict(zip(columns, row))
-                rows.append(row_dict)
+            _check_row_lengths(columns, data, block_name)
             
-            result[block_name] = rows
+            # Transform rows into dictionaries
+            result[block_name] = [dict(zip(columns, row)) for row in data]
         
         return result
     
@@ -63,6 +60,31 @@ def parse_json_response(response_data: Dict[str, Any]) -> Dict[str, List[Dict[st
         raise MoexParsingError("Failed to parse API response", data=response_data, original_error=e)
 
 
+def _check_row_lengths(columns: List[str], data: List[List[Any]], block_name: str) -> None:
+    """
+    Checks that every row of a block has one value per column.
+    
+    The row lengths are collected with map(len, ...) in a single C-level pass;
+    the offending row is only searched for when the check fails.
+    
+    Args:
+        columns: Column names of the block.
+        data: Rows of the block.
+        block_name: Name of the block (used in error messages).
+    
+    Raises:
+        MoexParsingError: If a row does not have one value per column.
+    """
+    if not data or set(map(len, data)) == {len(columns)}:
+        return
+    
+    row_length = next(len(row) for row in data if len(row) != len(columns))
+    raise MoexParsingError(
+        f"Column count mismatch in block '{block_name}': "
+        f"{len(columns)} columns defined but row has {row_length} values"
+    )
+
+
 def response_to_dataframe(
     parsed_response: Union[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]],
     block_name: Optional[str] = None
@@ -104,105 +126,221 @@ def response_to_dataframe(
         raise MoexParsingError("Failed to convert response to DataFrame", original_error=e)
 
 
+def block_to_dataframe(
+    columns: List[str],
+    data: List[List[Any]],
+    block_name: str = "",
+    dtypes: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+    """
+    Builds a DataFrame directly from the 'columns' and 'data' arrays of a MOEX ISS block.
+    
+    The row-major 'data' array is transposed into one sequence per column, so the
+    DataFrame is assembled column by column without creating a dictionary per row.
+    Columns listed in dtypes are created with that dtype straight away instead of
+    being converted after the DataFrame is built.
+    
+    Args:
+        columns: Column names of the block.
+        data: Rows of the block, each a list of values in column order.
+        block_name: Name of the block (used in error messages).
+        dtypes: Mapping of column names to dtypes (columns not in the block are ignored).
+    
+    Returns:
+        A DataFrame with one column per entry in columns.
+    
+    Raises:
+        MoexParsingError: If a row does not have one value per column.
+    """
+    _check_row_lengths(columns, data, block_name)
+    
+    dtypes = {column: dtype for column, dtype in (dtypes or {}).items() if column in columns}
+    
+    if not data:
+        return pd.DataFrame(columns=columns).astype(dtypes)
+    
+    column_data = dict(zip(columns, zip(*data)))
+    for column, dtype in dtypes.items():
+        column_data[column] = pd.Series(column_data[column], dtype=dtype)
+    
+    return pd.DataFrame(column_data)
+
+
+def json_response_to_dataframe(
+    response_data: Dict[str, Any],
+    block_name: Optional[str] = None,
+    block_dtypes: Optional[Dict[str, Dict[str, str]]] = None,
+) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """
+    Converts a raw JSON response from the MOEX ISS API into pandas DataFrame(s).
+    
+    This is equivalent to calling parse_json_response followed by
+    response_to_dataframe, but skips the intermediate row dictionaries.
+    
+    Args:
+        response_data: The JSON response from the API.
+        block_name: Name of the specific block to convert (if multiple blocks are present).
+        block_dtypes: Column dtypes per block name (see block_to_dataframe).
+    
+    Returns:
+        Either a single DataFrame if block_name is specified or a dictionary of DataFrames
+        where keys are block names.
+    
+    Raises:
+        MoexParsingError: If the specified block_name is not found or the data cannot be converted.
+    """
+    block_dtypes = block_dtypes or {}
+    
+    try:
+        blocks = {
+            name: content
+            for name, content in response_data.items()
+            if isinstance(content, dict) and 'columns' in content and 'data' in content
+        }
+        
+        # If block_name is specified, return only that block as DataFrame
+        if block_name is not None:
+            if block_name not in blocks:
+                raise MoexParsingError(f"Block '{block_name}' not found in response")
+            block = blocks[block_name]
+            return block_to_dataframe(
+                block['columns'], block['data'], block_name, block_dtypes.get(block_name)
+            )
+        
+        # Otherwise, convert all non-empty blocks to DataFrames
+        return {
+            name: block_to_dataframe(block['columns'], block['data'], name, block_dtypes.get(name))
+            for name, block in blocks.items()
+            if block['data']
+        }
+    
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        raise MoexParsingError("Failed to parse API response", data=response_data, original_error=e)
+
+
 def normalize_dataframe(
     df: pd.DataFrame,
     date_columns: Optional[List[str]] = None,
     numeric_columns: Optional[List[str]] = None,
     categorical_columns: Optional[List[str]] = None,
-    index_column: Optional[str] = None
+    index_column: Optional[str] = None,
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """
     Normalizes a DataFrame by converting columns to appropriate data types.
     
+    Converted columns are built first and applied with a single assign() call,
+    so the input is not copied as a whole and the result is not fragmented by
+    repeated column inserts.
+    
     Args:
         df: The DataFrame to normalize.
         date_columns: List of column names to convert to datetime.
         numeric_columns: List of column names to convert to numeric.
         categorical_columns: List of column names to convert to categorical.
         index_column: Column to set as the DataFrame index.
+        inplace: Whether to modify df itself instead of returning a new DataFrame.
     
     Returns:
-        The normalized DataFrame.
+        The normalized DataFrame (df itself if inplace is True).
     """
-    df_copy = df.copy()
+    converted = {}
     
     # Convert date columns
-    if date_columns:
-        for col in date_columns:
-            if col in df_copy.columns:
-                df_copy[col] = pd.to_datetime(df_copy[col], errors='coerce')
+    for col in date_columns or []:
+        if col in df.columns:
+            converted[col] = pd.to_datetime(df[col], errors='coerce')
     
     # Convert numeric columns
-    if numeric_columns:
-        for col in numeric_columns:
-            if col in df_copy.columns:
-                df_copy[col] = pd.to_numeric(df_copy[col], errors='coerce')
+    for col in numeric_columns or []:
+        if col in df.columns:
+            converted[col] = pd.to_numeric(converted.get(col, df[col]), errors='coerce')
     
     # Convert categorical columns
-    if categorical_columns:
-        for col in categorical_columns:
-            if col in df_copy.columns:
-                df_copy[col] = df_copy[col].astype('category')
+    for col in categorical_columns or []:
+        if col in df.columns:
+            converted[col] = converted.get(col, df[col]).astype('category')
+    
+    if inplace:
+        for col, values in converted.items():
+            df[col] = values
+        result = df
+    else:
+        result = df.assign(**converted)
     
     # Set index
-    if index_column and index_column in df_copy.columns:
-        df_copy.set_index(index_column, inplace=True)
+    if index_column and index_column in result.columns:
+        result.set_index(index_column, inplace=True)
     
-    return df_copy
+    return result
 
 
-def detect_and_convert_types(df: pd.DataFrame) -> pd.DataFrame:
+def detect_and_convert_types(df: pd.DataFrame, categorize: bool = True) -> pd.DataFrame:
     """
     Automatically detects and converts DataFrame columns to appropriate types.
     
     This function attempts to intelligently convert columns based on their content:
-    - Date columns (with strings like 'YYYY-MM-DD')
     - Numeric columns (integers and floats)
+    - Date columns (with strings like 'YYYY-MM-DD')
     - Boolean columns (with 1/0 values)
+    - Categorical columns (remaining string columns with few distinct values,
+      such as BOARDID or CURRENCYID)
+    
+    Each check converts the column with errors='coerce' and accepts the result
+    if no new missing values appeared, so the converted column is reused rather
+    than parsed a second time. The input is not copied; the converted columns
+    are combined with the untouched ones in a single assign() call.
+    
+    Both object columns and pandas string columns (e.g. after convert_dtypes(),
+    or the default string dtype in newer pandas) are checked.
     
     Args:
         df: The DataFrame to process.
+        categorize: Whether to convert low-cardinality string columns to category.
     
     Returns:
         A new DataFrame with converted data types.
     """
-    df_copy = df.copy()
-    
-    # First pass: identify column types
-    date_columns = []
-    numeric_columns = []
-    boolean_columns = []
+    converted = {}
     
-    for column in df_copy.columns:
-        # Skip columns that are already non-object types
-        if df_copy[column].dtype != 'object':
+    for column in df.columns:
+        values = df[column]
+        
+        # Skip columns that are already typed (object and string columns are checked)
+        if isinstance(values.dtype, pd.CategoricalDtype) or not (
+            pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)
+        ):
             continue
         
-        # Check for date columns
-        if df_copy[column].str.match(r'^\d{4}-\d{2}-\d{2}$').all(skipna=True):
-            date_columns.append(column)
+        present = values.notna()
+        if not present.any():
             continue
         
         # Check for numeric columns
-        if pd.to_numeric(df_copy[column], errors='coerce').notna().all():
-            numeric_columns.append(column)
+        numeric = pd.to_numeric(values, errors='coerce')
+        if numeric[present].notna().all():
+            converted[column] = numeric
+            continue
+        
+        # Check for date columns
+        dates = pd.to_datetime(values, format='%Y-%m-%d', errors='coerce')
+        if dates[present].notna().all():
+            converted[column] = dates
             continue
         
         # Check for boolean columns (1/0)
-        if df_copy[column].isin(['0', '1', 0, 1]).all(skipna=True):
-            boolean_columns.append(column)
+        if values[present].isin(['0', '1', 0, 1]).all():
+            converted[column] = values.isin(['1', 1, True])
             continue
+        
+        # Check for categorical columns (repeated values)
+        if categorize:
+            unique_count = values.nunique(dropna=True)
+            if (
+                unique_count <= _MAX_CATEGORIES
+                and unique_count < len(values) * _MAX_CATEGORY_RATIO
+            ):
+                converted[column] = values.astype('category')
     
-    # Convert date columns
-    for col in date_columns:
-        df_copy[col] = pd.to_datetime(df_copy[col])
-    
-    # Convert numeric columns
-    for col in numeric_columns:
-        df_copy[col] = pd.to_numeric(df_copy[col])
-    
-    # Convert boolean columns
-    for col in boolean_columns:
-        df_copy[col] = df_copy[col].isin(['1', 1, True])
-    
-    return df_copy
+    # Apply all conversions at once instead of inserting into a copy column by column
+    return df.assign(**converted)
@@ -7,6 +7,9 @@ covering request construction, response parsing, error handling, and rate limiti
 
 import datetime
 import json
+import re
+import tempfile
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 
@@ -32,6 +35,7 @@ class MockResponse:
         self._data = data
         self.headers = headers or {}
         self.text = json.dumps(data) if isinstance(data, (dict, list)) else str(data)
+        self.content = self.text.encode("utf-8")
     
     def json(self):
         """Return response data as JSON."""
@@ -43,9 +47,21 @@ class MockResponse:
 class TestMoexApiClient(unittest.TestCase):
     """Test cases for the MoexApiClient class."""
     
+    # Board securities URL, capturing (engine, market, board)
+    _SEC_URL_RE = re.compile(r"/engines/(\w+)/markets/(\w+)/boards/(\w+)/securities")
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create one client (and HTTP session) shared by all tests."""
+        cls.client = MoexApiClient()
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.client = MoexApiClient()
+        # Reset the shared client's rate limiter and reference cache
+        self.client._tokens = self.client._capacity
+        self.client._last_refill = time.monotonic()
+        self.client._rate_factor = 1.0
+        self.client._reference_cache.clear()
         
         # Sample API responses
         self.engines_response = {
@@ -80,13 +96,33 @@ class TestMoexApiClient(unittest.TestCase):
         
         # Verify the request
         mock_get.assert_called_once()
-        self.assertIn("/engines", mock_get.call_args[0][0])
+        self.assertEqual(mock_get.call_args[0][0], "https://iss.moex.com/iss/engines.json")
         
         # Verify the response processing
         self.assertIsInstance(engines, pd.DataFrame)
         self.assertEqual(len(engines), 3)
         self.assertIn("id", engines.columns)
-        self.assertEqual(engines.iloc[0]["id"], "stock")
+        self.assertEqual(engines["id"].iat[0], "stock")
+    
+    @patch("requests.Session.get")
+    def test_reference_cache(self, mock_get):
+        """Test that reference listings are cached and revalidated with ETags."""
+        mock_get.return_value = MockResponse(200, self.engines_response, headers={"ETag": '"v1"'})
+        
+        # A second call within the TTL is served from the cache
+        self.client.get_engines()
+        engines = self.client.get_engines()
+        mock_get.assert_called_once()
+        self.assertEqual(len(engines), 3)
+        
+        # Once expired, the listing is revalidated and a 304 reuses the cached copy
+        with patch.object(self.client, "REFERENCE_TTL", 0):
+            self.client._reference_cache.clear()
+            self.client.get_engines()
+            mock_get.return_value = MockResponse(304, "")
+            engines = self.client.get_engines()
+        self.assertEqual(mock_get.call_args[1]["headers"], {"If-None-Match": '"v1"'})
+        self.assertEqual(len(engines), 3)
     
     @patch("requests.Session.get")
     def test_get_securities(self, mock_get):
@@ -100,17 +136,153 @@ class TestMoexApiClient(unittest.TestCase):
         # Verify the request
         mock_get.assert_called_once()
         url_called = mock_get.call_args[0][0]
-        self.assertIn("/engines/stock/markets/shares/boards/TQBR/securities", url_called)
+        self.assertEqual(self._SEC_URL_RE.search(url_called).groups(), ("stock", "shares", "TQBR"))
         
         # Verify the response processing
         self.assertIsInstance(securities, pd.DataFrame)
         self.assertEqual(len(securities), 2)
         self.assertIn("SECID", securities.columns)
-        self.assertEqual(securities.iloc[0]["SECID"], "SBER")
-        self.assertEqual(securities.iloc[1]["SECID"], "GAZP")
+        self.assertEqual(securities["SECID"].iat[0], "SBER")
+        self.assertEqual(securities["SECID"].iat[1], "GAZP")
+        self.assertEqual(securities["BOARDID"].dtype, "category")
     
     @patch("requests.Session.get")
-    def test_connection_error(self, mock_get):
+    def test_market_history_pagination(self, mock_get):
+        """Test that all history pages are fetched and combined in order."""
+        closes = [141.1, 141.8, 140.2]
+        
+        def history_page(url, params, timeout, headers):
+            start = int(params["start"])
+            return MockResponse(200, {
+                "history": {
+                    "columns": ["TRADEDATE", "SECID", "CLOSE"],
+                    "data": [[f"2023-01-{9 + start:02d}", "SBER", closes[start]]],
+                },
+                "history.cursor": {
+                    "columns": ["INDEX", "TOTAL", "PAGESIZE"],
+                    "data": [[start, len(closes), 1]],
+                },
+            })
+        
+        mock_get.side_effect = history_page
+        
+        history = self.client.get_market_history(
+            "SBER", engine="stock", market="shares", board="TQBR", columns=["SECID", "CLOSE"]
+        )
+        
+        # Verify one request per page, each limited to the requested columns
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(mock_get.call_args[1]["params"]["history.columns"], "SECID,CLOSE")
+        
+        # Verify that rows from all pages are present in page order
+        self.assertEqual(len(history), 3)
+        self.assertEqual(list(history["CLOSE"]), closes)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(history["TRADEDATE"]))
+    
+    @patch("requests.Session.get")
+    def test_closed_range_disk_cache(self, mock_get):
+        """Test that candles for a date range in the past are cached on disk."""
+        def candles_page(url, params, timeout, headers):
+            data = [[141.1, 141.8, 142.0, 140.9, 1.5e9, 10500000, "2023-01-09 00:00:00", "2023-01-09 23:59:59"]]
+            return MockResponse(200, {
+                "candles": {
+                    "columns": ["open", "close", "high", "low", "value", "volume", "begin", "end"],
+                    "data": data if params["start"] == "0" else [],
+                }
+            })
+        
+        mock_get.side_effect = candles_page
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = MoexApiClient(cache_dir=cache_dir).get_candles(
+                "SBER", engine="stock", market="shares", board="TQBR",
+                start_date="2023-01-09", end_date="2023-01-10",
+            )
+            request_count = mock_get.call_count
+            
+            # A new client with the same cache directory does not hit the network
+            second = MoexApiClient(cache_dir=cache_dir).get_candles(
+                "SBER", engine="stock", market="shares", board="TQBR",
+                start_date="2023-01-09", end_date="2023-01-10",
+            )
+        
+        self.assertEqual(mock_get.call_count, request_count)
+        pd.testing.assert_frame_equal(first, second)
+    
+    @patch("requests.Session.get")
+    def test_securities_disk_cache_ttl(self, mock_get):
+        """Test that cached securities listings are refetched once they expire."""
+        mock_get.return_value = MockResponse(200, self.securities_response)
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = MoexApiClient(cache_dir=cache_dir)
+            client.get_securities(engine="stock", market="shares", board="TQBR")
+            cached = client.get_securities(engine="stock", market="shares", board="TQBR")
+            self.assertEqual(mock_get.call_count, 1)
+            self.assertEqual(len(cached), 2)
+            
+            # An expired listing is requested again
+            client.SECURITIES_TTL = 0
+            client.get_securities(engine="stock", market="shares", board="TQBR")
+            self.assertEqual(mock_get.call_count, 2)
+    
+    @patch("requests.Session.get")
+    def test_get_board_market_data(self, mock_get):
+        """Test fetching market data for a whole board in one request."""
+        mock_get.return_value = MockResponse(200, {
+            **self.securities_response,
+            "marketdata": {
+                "columns": ["SECID", "BOARDID", "LAST"],
+                "data": [["SBER", "TQBR", 250.4], ["GAZP", "TQBR", 175.6]],
+            },
+        })
+        
+        blocks = self.client.get_board_market_data("stock", "shares", "TQBR", with_securities=True)
+        
+        # Verify a single request for both blocks
+        mock_get.assert_called_once()
+        self.assertEqual(mock_get.call_args[1]["params"]["iss.only"], "securities,marketdata")
+        self.assertEqual(list(blocks), ["securities", "marketdata"])
+        self.assertEqual(list(blocks["marketdata"]["LAST"]), [250.4, 175.6])
+    
+    @patch("requests.Session.get")
+    def test_get_many_market_data(self, mock_get):
+        """Test fetching market data for several securities concurrently."""
+        mock_get.return_value = MockResponse(200, {
+            "marketdata": {
+                "columns": ["SECID", "LAST"],
+                "data": [["SBER", 250.4]],
+            }
+        })
+        
+        market_data = self.client.get_many_market_data(
+            ["SBER", "GAZP"], engine="stock", market="shares", board="TQBR"
+        )
+        
+        # Verify one request per security
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(list(market_data), ["SBER", "GAZP"])
+        self.assertIsInstance(market_data["GAZP"], pd.DataFrame)
+    
+    @patch("requests.Session.get")
+    def test_get_many_securities(self, mock_get):
+        """Test fetching the securities of several boards concurrently."""
+        mock_get.return_value = MockResponse(200, self.securities_response)
+        specs = [("stock", "shares", "TQBR"), ("stock", "bonds", "TQCB")]
+        
+        securities = self.client.get_many_securities(specs)
+        
+        # Verify one request per board
+        self.assertCountEqual(
+            [self._SEC_URL_RE.search(call[0][0]).groups() for call in mock_get.call_args_list],
+            specs,
+        )
+        self.assertEqual(list(securities), specs)
+        self.assertEqual(len(securities[("stock", "bonds", "TQCB")]), 2)
+    
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_connection_error(self, mock_get, mock_sleep):
         """Test handling of connection errors."""
         # Setup mock to raise a connection error
         mock_get.side_effect = requests.exceptions.ConnectionError("Connection refused")
@@ -119,8 +291,44 @@ class TestMoexApiClient(unittest.TestCase):
         with self.assertRaises(MoexConnectionError) as context:
             self.client.get_engines()
         
-        # Verify error message
+        # Verify error message and that the request was retried
         self.assertIn("Failed to connect", str(context.exception))
+        self.assertEqual(mock_get.call_count, self.client.max_retries + 1)
+    
+    @patch("random.uniform", return_value=1.0)
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_connection_error_retry(self, mock_get, mock_sleep, mock_uniform):
+        """Test that a transient connection error is retried with backoff."""
+        mock_get.side_effect = [
+            requests.exceptions.ConnectionError("Connection reset"),
+            MockResponse(200, self.engines_response),
+        ]
+        
+        engines = self.client.get_engines()
+        
+        # Verify the request succeeded after backing off for the base delay
+        self.assertEqual(len(engines), 3)
+        self.assertEqual(mock_get.call_count, 2)
+        mock_sleep.assert_any_call(self.client.base_backoff)
+    
+    @patch("random.uniform", return_value=1.0)
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_server_error_retry(self, mock_get, mock_sleep, mock_uniform):
+        """Test that transient 5xx responses are retried with exponential backoff."""
+        mock_get.side_effect = [
+            MockResponse(503, {}),
+            MockResponse(502, {}),
+            MockResponse(200, self.engines_response),
+        ]
+        
+        engines = self.client.get_engines()
+        
+        self.assertEqual(len(engines), 3)
+        self.assertEqual(mock_get.call_count, 3)
+        mock_sleep.assert_any_call(self.client.base_backoff)
+        mock_sleep.assert_any_call(self.client.base_backoff * 2)
     
     @patch("requests.Session.get")
     def test_http_error(self, mock_get):
@@ -150,8 +358,9 @@ class TestMoexApiClient(unittest.TestCase):
         self.assertEqual(context.exception.status_code, 401)
         self.assertIn("Authentication failed", str(context.exception))
     
+    @patch("time.sleep")
     @patch("requests.Session.get")
-    def test_rate_limit_error(self, mock_get):
+    def test_rate_limit_error(self, mock_get, mock_sleep):
         """Test handling of rate limit errors."""
         # Setup mock to return a 429 error
         mock_get.return_value = MockResponse(
@@ -168,6 +377,22 @@ class TestMoexApiClient(unittest.TestCase):
         self.assertEqual(context.exception.status_code, 429)
         self.assertIn("Rate limit exceeded", str(context.exception))
         self.assertEqual(context.exception.retry_after, 60)
+        self.assertEqual(mock_get.call_count, self.client.max_retries + 1)
+    
+    @patch("random.uniform", return_value=1.0)
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_rate_limit_without_retry_after(self, mock_get, mock_sleep, mock_uniform):
+        """Test that a 429 response without Retry-After backs off exponentially."""
+        mock_get.side_effect = [
+            MockResponse(429, {}),
+            MockResponse(200, self.engines_response),
+        ]
+        
+        self.client.get_engines()
+        
+        self.assertEqual(mock_get.call_count, 2)
+        mock_sleep.assert_any_call(self.client.base_backoff)
     
     @patch("requests.Session.get")
     def test_invalid_json(self, mock_get):
@@ -179,28 +404,80 @@ class TestMoexApiClient(unittest.TestCase):
         with self.assertRaises(MoexParsingError) as context:
             self.client.get_engines()
         
-        # Verify error message
+        # Verify error message and the captured body
         self.assertIn("Failed to parse JSON", str(context.exception))
+        self.assertEqual(context.exception.data, "This is not JSON")
+    
+    @patch("requests.Session.get")
+    def test_non_json_content_type(self, mock_get):
+        """Test that bodies declared as non-JSON are rejected without parsing."""
+        mock_get.return_value = MockResponse(
+            200, "<html>Service unavailable</html>", headers={"Content-Type": "text/html"}
+        )
+        
+        with self.assertRaises(MoexParsingError) as context:
+            self.client.get_securities()
+        
+        self.assertIn("text/html", str(context.exception))
+        self.assertEqual(context.exception.data, "<html>Service unavailable</html>")
     
     @patch("time.sleep")
-    @patch("time.time")
+    @patch("time.monotonic")
     @patch("requests.Session.get")
-    def test_rate_limiting(self, mock_get, mock_time, mock_sleep):
+    def test_rate_limiting(self, mock_get, mock_monotonic, mock_sleep):
         """Test that rate limiting is applied between requests."""
         # Setup mocks
-        mock_get.return_value = MockResponse(200, self.engines_response)
-        mock_time.side_effect = [0, 0.1]  # First call returns 0, second 0.1
+        mock_get.return_value = MockResponse(200, self.securities_response)
+        mock_monotonic.side_effect = [0, 0, 0.1]  # Client creation, first and second request
         
         # Set a rate limit of 0.5 seconds
-        self.client.rate_limit = 0.5
+        client = MoexApiClient(rate_limit=0.5)
         
-        # Make request
-        self.client.get_engines()
+        # Make requests
+        client.get_securities()
+        client.get_securities()
         
-        # Verify sleep was called
+        # Verify sleep was called before the second request only
         mock_sleep.assert_called_once()
         sleep_time = mock_sleep.call_args[0][0]
         self.assertAlmostEqual(sleep_time, 0.4, places=1)  # Should sleep for 0.5 - 0.1 = 0.4s
+    
+    @patch("time.sleep")
+    @patch("time.monotonic")
+    @patch("requests.Session.get")
+    def test_rate_limit_burst(self, mock_get, mock_monotonic, mock_sleep):
+        """Test that an idle client sends up to `burst` requests without waiting."""
+        mock_get.return_value = MockResponse(200, self.securities_response)
+        mock_monotonic.side_effect = [0, 0, 0, 0, 0]  # Client creation and four requests
+        
+        client = MoexApiClient(rate_limit=0.5, burst=3)
+        
+        for _ in range(3):
+            client.get_securities()
+        mock_sleep.assert_not_called()
+        
+        # The bucket is empty, so the fourth request is paced
+        client.get_securities()
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 0.5)
+    
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_rate_limit_backoff(self, mock_get, mock_sleep):
+        """Test that a 429 response slows down subsequent requests."""
+        mock_get.return_value = MockResponse(429, {}, headers={"Retry-After": "2"})
+        client = MoexApiClient(max_retries=0)
+        
+        with self.assertRaises(MoexRateLimitError):
+            client.get_engines()
+        
+        # The next request waits for Retry-After at the halved rate
+        mock_get.return_value = MockResponse(200, self.engines_response)
+        client.get_engines()
+        
+        mock_sleep.assert_called_once()
+        self.assertGreater(mock_sleep.call_args[0][0], 2.0)
+        self.assertAlmostEqual(client._rate_factor, 0.6)
 
 
 if __name__ == "__main__":
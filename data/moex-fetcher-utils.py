@@ -7,8 +7,16 @@ MOEX ISS API.
 """
 
 import datetime
+import re
 from typing import Dict, List, Optional, Union, Any
-from urllib.parse import urljoin, urlencode
+from urllib.parse import urlencode
+
+
+# Matches the plain 'YYYY-MM-DD' and 'YYYY-MM-DD hh:mm:ss' timestamps used by MOEX ISS
+_ISO_DATETIME_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2}):(\d{2}))?")
+
+# Date string formats accepted by format_date besides ISO 8601
+_DATE_FORMATS = ('%Y-%m-%d', '%d.%m.%Y', '%m/%d/%Y', '%Y/%m/%d')
 
 
 def build_url(base_url: str, endpoint: str, **path_params) -> str:
@@ -18,26 +26,26 @@ def build_url(base_url: str, endpoint: str, **path_params) -> str:
     
     Args:
         base_url: The base URL for the API.
-        endpoint: The API endpoint (can contain placeholders like '[engine]').
+        endpoint: The API endpoint (can contain placeholders like '{engine}').
         **path_params: Key-value pairs for replacing placeholders in the endpoint.
     
     Returns:
         A complete URL with path parameters replaced.
     
+    Raises:
+        KeyError: If a placeholder in the endpoint has no matching path parameter.
+    
     Example:
         >>> build_url('https://iss.moex.com/iss', 
-                      '/engines/[engine]/markets/[market]/securities',
+                      '/engines/{engine}/markets/{market}/securities',
                       engine='stock', market='shares')
         'https://iss.moex.com/iss/engines/stock/markets/shares/securities'
     """
-    # Replace placeholders in the endpoint
-    for key, value in path_params.items():
-        placeholder = f"[{key}]"
-        if placeholder in endpoint:
-            endpoint = endpoint.replace(placeholder, str(value))
+    # Same placeholder syntax as the client's endpoint templates; extra keys are ignored
+    endpoint = endpoint.format_map(path_params)
     
-    # Join base URL with endpoint
-    return urljoin(base_url, endpoint)
+    # Append the endpoint to the base URL (urljoin would drop the base path, e.g. '/iss')
+    return base_url.rstrip("/") + "/" + endpoint.lstrip("/")
 
 
 def format_date(date_value: Union[str, datetime.date, datetime.datetime]) -> str:
@@ -50,32 +58,53 @@ def format_date(date_value: Union[str, datetime.date, datetime.datetime]) -> str
     Returns:
         A string in the format 'YYYY-MM-DD'.
     
+    Raises:
+        ValueError: If the date_value cannot be parsed.
+    """
+    return _to_date(date_value).isoformat()
+
+
+def _to_date(date_value: Union[str, datetime.date, datetime.datetime]) -> datetime.date:
+    """
+    Converts a date object or string to a datetime.date.
+    
+    Args:
+        date_value: A date object, datetime object, or string in a valid date format.
+    
+    Returns:
+        The date (the time of day of a datetime is dropped).
+    
     Raises:
         ValueError: If the date_value cannot be parsed.
     """
     if isinstance(date_value, str):
-        try:
-            # Try parsing as ISO format
-            date_obj = datetime.datetime.fromisoformat(date_value)
-        except ValueError:
+        date_obj = None
+        
+        # Try parsing as ISO format, but only for strings that start like 'YYYY-'
+        if len(date_value) >= 10 and date_value[4] == '-':
             try:
-                # Try common date formats
-                for fmt in ('%Y-%m-%d', '%d.%m.%Y', '%m/%d/%Y', '%Y/%m/%d'):
-                    try:
-                        date_obj = datetime.datetime.strptime(date_value, fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    raise ValueError(f"Could not parse date: {date_value}")
-            except Exception as e:
-                raise ValueError(f"Invalid date format: {date_value}") from e
+                date_obj = datetime.datetime.fromisoformat(date_value)
+            except ValueError:
+                pass
+        
+        # Try common date formats
+        if date_obj is None:
+            for fmt in _DATE_FORMATS:
+                try:
+                    date_obj = datetime.datetime.strptime(date_value, fmt)
+                    break
+                except ValueError:
+                    continue
+            else:
+                raise ValueError(f"Invalid date format: {date_value}")
     elif isinstance(date_value, (datetime.date, datetime.datetime)):
         date_obj = date_value
     else:
         raise ValueError(f"Expected date string or date object, got {type(date_value).__name__}")
     
-    return date_obj.strftime('%Y-%m-%d')
+    if isinstance(date_obj, datetime.datetime):
+        return date_obj.date()
+    return date_obj
 
 
 def validate_date_range(
@@ -101,18 +130,17 @@ def validate_date_range(
     if end_date is None:
         end_date = datetime.date.today()
     
-    # Format dates
-    formatted_end_date = format_date(end_date)
+    # Dates are compared as date objects and only formatted for the result
+    end_obj = _to_date(end_date)
     
     # If start_date is not provided, set it to end_date
     if start_date is None:
+        formatted_end_date = end_obj.isoformat()
         return (formatted_end_date, formatted_end_date)
     
-    formatted_start_date = format_date(start_date)
-    
-    # Parse the formatted dates back to check the interval
-    start_obj = datetime.datetime.strptime(formatted_start_date, '%Y-%m-%d').date()
-    end_obj = datetime.datetime.strptime(formatted_end_date, '%Y-%m-%d').date()
+    start_obj = _to_date(start_date)
+    formatted_start_date = start_obj.isoformat()
+    formatted_end_date = end_obj.isoformat()
     
     # Ensure start_date is not after end_date
     if start_obj > end_obj:
@@ -130,6 +158,20 @@ def validate_date_range(
     return (formatted_start_date, formatted_end_date)
 
 
+def _join_values(values) -> str:
+    """Converts a list of values to a comma-separated string."""
+    return ','.join(map(str, values))
+
+
+# Query parameter converters by value type (other types are converted with str)
+_PARAM_CONVERTERS = {
+    str: str,
+    list: _join_values,
+    tuple: _join_values,
+    bool: lambda value: '1' if value else '0',
+}
+
+
 def build_query_params(params: Dict[str, Any]) -> Dict[str, str]:
     """
     Builds query parameters for API requests, handling special cases like lists.
@@ -145,16 +187,9 @@ def build_query_params(params: Dict[str, Any]) -> Dict[str, str]:
     for key, value in params.items():
         if value is None:
             continue
-            
-        if isinstance(value, list):
-            # Convert list to comma-separated string
-            result[key] = ','.join(str(item) for item in value)
-        elif isinstance(value, bool):
-            # Convert bool to integer
-            result[key] = '1' if value else '0'
-        else:
-            # Convert other types to string
-            result[key] = str(value)
+        
+        # Look up the converter by exact type (so bools are not treated as ints)
+        result[key] = _PARAM_CONVERTERS.get(type(value), str)(value)
     
     return result
 
@@ -172,6 +207,14 @@ def parse_iso_datetime(datetime_str: str) -> datetime.datetime:
     Raises:
         ValueError: If the string cannot be parsed.
     """
+    # Fast path for the common MOEX shapes, without exceptions
+    match = _ISO_DATETIME_RE.fullmatch(datetime_str)
+    if match:
+        try:
+            return datetime.datetime(*(int(part) for part in match.groups() if part is not None))
+        except ValueError:
+            pass  # Out-of-range values are reported by the general path below
+    
     try:
         # For full ISO format with microseconds and timezone
         return datetime.datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
@@ -0,0 +1,327 @@
+"""
+Reference tables describing the MOEX market structure.
+
+The tables are embedded as CSV literals and parsed lazily: each loader parses
+its table on first use and returns the same DataFrame on every later call, so
+scripts that share a process pay for the pandas import and each parse once.
+The returned DataFrames are shared and should be treated as read-only.
+"""
+
+import functools
+from io import StringIO
+
+import pandas as pd
+
+
+_BOARDS_CSV = """
+id,board_group_id,engine_id,market_id,boardid,board_title,is_traded,has_candles,is_primary
+177,57,1,1,TQIF,Т+: Паи - безадрес.,1,1,1
+178,57,1,1,TQTF,Т+: ETF - безадрес.,1,1,1
+129,57,1,1,TQBR,Т+: Акции и ДР - безадрес.,1,1,1
+130,57,1,1,TQBS,Т+: А2-Акции и паи - безадрес.,0,1,1
+131,57,1,1,TQNL,Т+: Б-Акции и паи - безадрес.,0,1,1
+132,57,1,1,TQLV,Т+: В-Акции и ДР - безадрес.,0,1,1
+225,156,1,1,TQTD,Т+: ETF (USD) - безадрес.,1,1,0
+429,156,1,1,TQFD,Т+: ПАИ (USD) - безадрес.,1,1,0
+313,157,1,1,TQBE,Т+: Акции и ДР (EUR) - безадрес.,0,1,0
+314,157,1,1,TQTE,Т+: ETF (EUR) - безадрес.,1,1,0
+1216,1215,1,1,TQTY,Т+: ПАИ (CNY) - безадрес.,1,1,0
+1239,1238,1,1,TQTH,Т+: ПАИ (HKD) - безадрес.,1,1,0
+135,58,1,2,TQOB,Т+: Гособлигации - безадрес.,1,1,1
+349,58,1,2,TQCB,Т+: Облигации - безадрес.,1,1,1
+361,58,1,2,TQRD,Т+: Облигации Д - безадрес.,1,1,1
+226,193,1,2,TQOD,Т+: Облигации (USD) - безадрес.,1,1,0
+363,193,1,2,TQUD,Т+: Облигации Д (USD) - безадрес.,1,1,0
+357,207,1,2,TQOE,Т+: Облигации (EUR) - безадрес.,1,1,0
+1101,245,1,2,TQOY,Т+: Облигации (CNY) - безадрес.,1,1,0
+142,59,1,4,PTEQ,РПС с ЦК: Акции и ДР - адрес.,1,0,0
+148,282,1,4,PTOB,РПС с ЦК: Облигации - адрес.,1,0,0
+232,283,1,4,PTOD,РПС с ЦК: Облигации (USD) - адрес.,1,0,0
+359,209,1,4,PTOE,РПС с ЦК: Облигации (EUR) - адрес.,1,0,0
+1151,249,1,4,PTOY,РПС с ЦК: Облигации (CNY) - адрес.,1,0,0
+11,8,1,4,PSEQ,РПС: Акции - адрес.,1,0,1
+17,284,1,4,PSOB,РПС: Облигации - адрес.,1,0,0
+30,285,1,4,PSEU,РПС: Облигации (USD) - адрес.,1,0,0
+160,286,1,4,PSEO,РПС: Облигации (EUR) - адрес.,1,0,0
+236,247,1,4,PSYO,РПС: Облигации (CNY) - адрес.,1,0,0
+98,107,1,4,PSAU,Размещение - адрес.,1,0,0
+120,108,1,4,PSBB,Выкуп - адрес.,1,0,0
+282,126,1,4,OTCB,Анонимный РПС - адрес.,1,0,0
+44,9,1,5,SNDX,Индексы фондового рынка,1,1,1
+102,9,1,5,RTSI,Индексы РТС,1,1,1
+265,104,1,5,INAV,INAV,1,1,0
+312,155,1,5,MMIX,Money Market IndeX,1,1,0
+1029,1028,1,5,AGRO,Индексы НТБ,1,1,0
+123,50,1,27,EQRP,РЕПО с ЦК 1 день - безадрес.,1,1,1
+239,92,1,27,EQRD,РЕПО с ЦК 1 день (USD) - безадрес.,1,1,0
+240,93,1,27,EQRE,РЕПО с ЦК 1 день (EUR) - безадрес.,1,1,0
+309,152,1,27,EQRY,РЕПО с ЦК 1 день (CNY) - безадрес.,1,1,0
+125,65,1,27,PSRP,РЕПО с ЦК - адрес.,1,1,0
+21,13,3,10,CETS,Системные сделки - безадрес.,1,1,1
+351,13,3,10,SDBP,Крупные сделки - безадрес.,1,1,1
+261,100,3,10,FIXS,Фиксинг системный - безадрес.,1,1,0
+116,46,3,10,CNGD,Внесистемные сделки- адрес.,1,1,0
+308,151,3,10,LICU,Внесистемные сделки урегулирования - безадрес.,1,1,0
+262,101,3,10,FIXN,Фиксинг внесистемный- адрес.,1,1,0
+182,70,3,10,AUCB,Аукцион ЦБР - адрес.,1,1,0
+256,88,3,34,FUTS,Фьючерсы системные - безадрес.,0,1,1
+257,89,3,34,FUTN,Фьючерсы внесистемные- адрес.,0,1,0
+321,165,3,41,FIXI,Валютный фиксинг,1,1,1
+101,45,4,22,RFUD,Фьючерсы,1,1,1
+103,35,4,24,ROPD,Опционы,1,1,1
+1333,1332,1326,1328,RPFC,РЕПО с ФК: закрытая форма,1,0,1
+1334,1332,1326,1328,RPFO,РЕПО с ФК: открытая форма,1,0,1
+1330,1329,1326,1327,DPFK,"Депозиты ФК, закрытая форма",1,0,1
+1331,1329,1326,1327,DPFO,"Депозиты ФК, открытая форма",1,0,1
+"""
+
+_BOARDS_DTYPES = {
+    'id': 'int64', 'board_group_id': 'int64', 'engine_id': 'int64', 'market_id': 'int64',
+    'boardid': str, 'board_title': str,
+    'is_traded': 'int64', 'has_candles': 'int64', 'is_primary': 'int64',
+}
+
+_ENGINES_CSV = """
+id,name,title
+1,stock,Фондовый рынок и рынок депозитов
+2,state,Рынок ГЦБ (размещение)
+3,currency,Валютный рынок
+4,futures,Срочный рынок
+5,commodity,Товарный рынок
+6,interventions,Товарные интервенции
+7,offboard,ОТС-система
+9,agro,Агро
+1012,otc,ОТС с ЦК
+1282,quotes,Квоты
+1326,money,Денежный рынок
+"""
+
+_ENGINES_DTYPES = {'id': 'int64', 'name': str, 'title': str}
+
+_HIERARCHY_CSV = """
+engine_id,engine_name,engine_title,market_id,market_name,market_title,board_group_id,board_group_name,board_group_title,is_default
+1,stock,Фондовый рынок и рынок депозитов,1,shares,Рынок акций,57,stock_shares_tplus,Т+: Основной режим - безадрес.,1
+1,stock,Фондовый рынок и рынок депозитов,1,shares,Рынок акций,156,stock_shares_tplus_usd,Т+: Основной режим (USD) - безадрес.,0
+1,stock,Фондовый рынок и рынок депозитов,1,shares,Рынок акций,157,stock_shares_tplus_eur,Т+: Основной режим (EUR) - безадрес.,0
+1,stock,Фондовый рынок и рынок депозитов,1,shares,Рынок акций,1215,stock_shares_tplus_cny,Т+: Основной режим (CNY) - безадрес.,0
+1,stock,Фондовый рынок и рынок депозитов,2,bonds,Рынок облигаций,58,stock_bonds_tplus,Т+: Основной режим - безадрес.,1
+1,stock,Фондовый рынок и рынок депозитов,2,bonds,Рынок облигаций,193,stock_bonds_tplus_usd,Т+: Основной режим (USD) - безадрес.,0
+1,stock,Фондовый рынок и рынок депозитов,2,bonds,Рынок облигаций,207,stock_bonds_tplus_eur,Т+: Облигации (EUR) - безадрес.,0
+1,stock,Фондовый рынок и рынок депозитов,2,bonds,Рынок облигаций,245,stock_bonds_tplus_cny,Т+: Облигации (CNY) - безадрес.,0
+1,stock,Фондовый рынок и рынок депозитов,5,index,Индексы фондового рынка,9,stock_index,Индексы,1
+3,currency,Валютный рынок,10,selt,Биржевые сделки с ЦК,13,currency,Системные сделки - безадрес.,1
+3,currency,Валютный рынок,41,index,Валютный фиксинг,165,currency_index,Валютный фиксинг,1
+3,currency,Валютный рынок,1341,otcindices,Внебиржевые индексы,1342,currency_otcindices_fixing,Внебиржевые индикаторы - фиксинги,1
+4,futures,Срочный рынок,22,forts,ФОРТС,45,futures_forts,Фьючерсы,1
+4,futures,Срочный рынок,24,options,Опционы ФОРТС,35,futures_options,Опционы,1
+9,agro,Агро,51,sugar,Торги сахаром,271,agro_sugar_all,Агро: Сахар,1
+1326,money,Денежный рынок,1327,deposit,Депозиты ФК,1329,money_deposit,"Депозиты ФК, закрытая форма",1
+1326,money,Денежный рынок,1328,repo,РЕПО ФК,1332,money_repo,РЕПО с ФК: закрытая форма,1
+"""
+
+_HIERARCHY_DTYPES = {
+    'engine_id': 'int64', 'engine_name': str, 'engine_title': str,
+    'market_id': 'int64', 'market_name': str, 'market_title': str,
+    'board_group_id': 'int64', 'board_group_name': str, 'board_group_title': str,
+    'is_default': 'int64',
+}
+
+_MARKETS_CSV = """
+id,trade_engine_id,trade_engine_name,market_name,market_title,marketplace,is_otc
+1,1,stock,shares,Рынок акций,MXSE,0
+2,1,stock,bonds,Рынок облигаций,MXSE,0
+3,1,stock,repo,Рынок сделок РЕПО,,0
+4,1,stock,ndm,Режим переговорных сделок,,0
+5,1,stock,index,Индексы фондового рынка,INDICES,0
+10,3,currency,selt,Биржевые сделки с ЦК,MXCX,0
+12,4,futures,main,Срочные инструменты,,0
+22,4,futures,forts,ФОРТС,FORTS,0
+24,4,futures,options,Опционы ФОРТС,OPTIONS,0
+27,1,stock,ccp,РЕПО с ЦК,MXSE,0
+33,1,stock,moexboard,MOEX Board,,0
+35,1,stock,deposit,Депозиты с ЦК,,0
+36,1,stock,mamc,Мультивалютный рынок смешанных активов,,0
+41,3,currency,index,Валютный фиксинг,FIXING,0
+45,3,currency,otc,Внебиржевой,MXCX,0
+46,1,stock,gcc,РЕПО с ЦК с КСУ,MXSE,0
+47,1,stock,foreignshares,Иностранные ц.б.,MXSE,0
+49,1,stock,foreignndm,Иностранные ц.б. РПС,,0
+51,9,agro,sugar,Торги сахаром,,0
+54,1,stock,credit,Рынок кредитов,,0
+1013,1012,otc,bonds,Облигации,,1
+1014,1012,otc,ndm,Облигации c ЦК,,1
+1257,1012,otc,shares,Акции,,1
+1262,1012,otc,sharesndm,Акции с ЦК,,1
+1279,1282,quotes,bonds,Квоты облигации,,1
+1327,1326,money,deposit,Депозиты ФК,MONEY,0
+1328,1326,money,repo,РЕПО ФК,MONEY,0
+1341,3,currency,otcindices,Внебиржевые индексы,INDICES,1
+"""
+
+_MARKETS_DTYPES = {
+    'id': 'int64', 'trade_engine_id': 'int64', 'trade_engine_name': str,
+    'market_name': str, 'market_title': str, 'marketplace': str, 'is_otc': 'int64',
+}
+
+_SECURITY_COLLECTIONS_CSV = """
+id,name,title,security_group_id
+72,stock_index_all,Все индексы,12
+213,stock_index_shares,Основные индексы акций,12
+210,stock_index_shares_sectoral,Отраслевые индексы акций,12
+249,stock_index_total_return,Индексы акций полной доходности,12
+211,stock_index_shares_thematic,Тематические индексы акций,12
+207,stock_index_bonds,Основные индексы облигаций,12
+214,stock_index_bonds_state,Индексы государственных облигаций,12
+208,stock_index_bonds_corporate,Индексы корпоративных облигаций,12
+212,stock_index_bonds_municipal,Индексы муниципальных облигаций,12
+209,stock_index_bonds_retiring,Индексы активов пенсионных накоплений,12
+328,stock_index_eurobonds,Индексы еврооблигаций,12
+215,stock_index_volatility,Российские индексы волатильности,12
+259,stock_index_inav,INAV,12
+3,stock_shares_all,Все акции,4
+160,stock_shares_one,Уровень 1,4
+161,stock_shares_two,Уровень 2,4
+162,stock_shares_three,Уровень 3,4
+7,stock_bonds_all,Все,3
+163,stock_bonds_one,Все уровень 1,3
+164,stock_bonds_two,Все уровень 2,3
+165,stock_bonds_three,Все уровень 3,3
+189,stock_bonds_corp_all,Все корпоративные,3
+202,stock_bonds_corp_one,Корпоративные уровень 1,3
+194,stock_bonds_corp_two,Корпоративные уровень 2,3
+188,stock_bonds_corp_three,Корпоративные уровень 3,3
+200,stock_bonds_exchange_all,Все биржевые,3
+185,stock_exchange_corp_one,Биржевые уровень 1,3
+186,stock_bonds_ofz_all,Все ОФЗ,3
+193,stock_bonds_cb_all,Все Банка России,3
+177,currency_selt_all_spot,Все валюты СПОТ,9
+170,currency_selt_all_swap,Все валюты СВОП,9
+173,currency_selt_usd_spot,USD/RUB СПОТ,9
+174,currency_selt_usd_swap,USD/RUB СВОП,9
+172,currency_selt_eur_spot,EUR/RUB СПОТ,9
+179,currency_selt_eur_swap,EUR/RUB СВОП,9
+181,currency_selt_cny_spot,CNY/RUB СПОТ,9
+176,currency_selt_cny_swap,CNY/RUB СВОП,9
+227,futures_forts_all,Все фьючерсы,10
+226,futures_forts_index,Фьючерсы на индексы,10
+224,futures_forts_shares,Фьючерсы на акции,10
+225,futures_forts_currency,Фьючерсы на валюты,10
+228,futures_forts_interest,Фьючерсы на процентные ставки,10
+223,futures_forts_commodity,Фьючерсы на товарные контракты,10
+218,futures_options_all,Все опционы,26
+222,futures_options_index,Опционы ф. на индекс,26
+221,futures_options_shares,Опционы ф. на акции,26
+220,futures_options_currency,Опционы ф. на валюты,26
+219,futures_options_commodity,Опционы ф. на товарные контракты,26
+"""
+
+_SECURITY_COLLECTIONS_DTYPES = {'id': 'int64', 'name': str, 'title': str, 'security_group_id': 'int64'}
+
+_SECURITY_TYPES_CSV = """
+id,trade_engine_id,trade_engine_name,security_type_name,security_type_title,security_group_name
+3,1,stock,common_share,Акция обыкновенная,stock_shares
+1,1,stock,preferred_share,Акция привилегированная,stock_shares
+51,1,stock,depositary_receipt,Депозитарная расписка,stock_dr
+54,1,stock,ofz_bond,Государственная облигация,stock_bonds
+4,1,stock,cb_bond,Облигация центрального банка,stock_bonds
+41,1,stock,subfederal_bond,Региональная облигация,stock_bonds
+45,1,stock,municipal_bond,Муниципальная облигация,stock_bonds
+2,1,stock,corporate_bond,Корпоративная облигация,stock_bonds
+43,1,stock,exchange_bond,Биржевая облигация,stock_bonds
+42,1,stock,ifi_bond,Облигация МФО,stock_bonds
+60,1,stock,euro_bond,Еврооблигации,stock_eurobond
+7,1,stock,public_ppif,Пай открытого ПИФа,stock_ppif
+8,1,stock,interval_ppif,Пай интервального ПИФа,stock_ppif
+9,1,stock,private_ppif,Пай закрытого ПИФа,stock_ppif
+74,1,stock,exchange_ppif,Пай биржевого ПИФа,stock_ppif
+55,1,stock,etf_ppif,ETF,stock_etf
+44,1,stock,stock_index,Индекс фондового рынка,stock_index
+53,1,stock,rts_index,Индекс РТС,stock_index
+63,1,stock,stock_deposit,Депозит с ЦК,stock_deposit
+5,3,currency,currency,Валюта,currency_selt
+58,3,currency,gold_metal,Металл золото,currency_metal
+59,3,currency,silver_metal,Металл серебро,currency_metal
+73,3,currency,currency_fixing,Валютный фиксинг,currency_selt
+75,3,currency,currency_index,Валютный фиксинг,currency_indices
+6,4,futures,futures,Фьючерс,futures_forts
+52,4,futures,option,Опцион,futures_options
+1031,4,futures,option_on_shares,Опцион на акции,futures_options
+1291,4,futures,option_on_currency,Опцион на валюту,futures_options
+1293,4,futures,option_on_indices,Опцион на индексы,futures_options
+1295,4,futures,option_on_commodities,Опцион на товары,futures_options
+"""
+
+_SECURITY_TYPES_DTYPES = {
+    'id': 'int64', 'trade_engine_id': 'int64', 'trade_engine_name': str,
+    'security_type_name': str, 'security_type_title': str, 'security_group_name': str,
+}
+
+_SECURITY_GROUPS_CSV = """
+id,name,title,is_hidden
+12,stock_index,Индексы,0
+4,stock_shares,Акции,0
+3,stock_bonds,Облигации,0
+9,currency_selt,Валюта,0
+10,futures_forts,Фьючерсы,0
+26,futures_options,Опционы,0
+18,stock_dr,Депозитарные расписки,0
+33,stock_foreign_shares,Иностранные ц.б.,0
+6,stock_eurobond,Еврооблигации,0
+5,stock_ppif,Паи ПИФов,0
+20,stock_etf,Биржевые фонды,0
+24,currency_metal,Драгоценные металлы,0
+21,stock_qnv,Квал. инвесторы,0
+27,stock_gcc,Клиринговые сертификаты участия,0
+29,stock_deposit,Депозиты с ЦК,0
+28,currency_futures,Валютный фьючерс,0
+31,currency_indices,Валютные фиксинги,0
+"""
+
+_SECURITY_GROUPS_DTYPES = {'id': 'int64', 'name': str, 'title': str, 'is_hidden': 'int64'}
+
+
+def _read_table(data: str, dtype: dict) -> pd.DataFrame:
+    """Parses an embedded CSV literal with explicit column types."""
+    return pd.read_csv(StringIO(data.strip()), sep=",", dtype=dtype)
+
+
+@functools.lru_cache(maxsize=None)
+def boards() -> pd.DataFrame:
+    """Trading boards (a sample of the full MOEX board list)."""
+    return _read_table(_BOARDS_CSV, _BOARDS_DTYPES)
+
+
+@functools.lru_cache(maxsize=None)
+def engines() -> pd.DataFrame:
+    """Trading engines."""
+    return _read_table(_ENGINES_CSV, _ENGINES_DTYPES)
+
+
+@functools.lru_cache(maxsize=None)
+def hierarchy() -> pd.DataFrame:
+    """Engine -> market -> board group hierarchy."""
+    return _read_table(_HIERARCHY_CSV, _HIERARCHY_DTYPES)
+
+
+@functools.lru_cache(maxsize=None)
+def markets() -> pd.DataFrame:
+    """Markets (limited sample for brevity)."""
+    return _read_table(_MARKETS_CSV, _MARKETS_DTYPES)
+
+
+@functools.lru_cache(maxsize=None)
+def security_collections() -> pd.DataFrame:
+    """Security collections."""
+    return _read_table(_SECURITY_COLLECTIONS_CSV, _SECURITY_COLLECTIONS_DTYPES)
+
+
+@functools.lru_cache(maxsize=None)
+def security_types() -> pd.DataFrame:
+    """Security types."""
+    return _read_table(_SECURITY_TYPES_CSV, _SECURITY_TYPES_DTYPES)
+
+
+@functools.lru_cache(maxsize=None)
+def security_groups() -> pd.DataFrame:
+    """Security groups."""
+    return _read_table(_SECURITY_GROUPS_CSV, _SECURITY_GROUPS_DTYPES)